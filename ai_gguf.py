@@ -7,24 +7,78 @@ Customizable script for running AI models in GGUF format
 import os
 import sys
 import json
+import socket
+import hashlib
 import argparse
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 import logging
 
+# Optional fast JSON encoder/decoder
 try:
-    from llama_cpp import Llama
+    import orjson
 except ImportError:
-    print("Error: llama-cpp-python not installed.")
-    print("Install it with: pip install llama-cpp-python")
-    print("For GPU support (CUDA): CMAKE_ARGS=\"-DLLAMA_CUBLAS=on\" pip install llama-cpp-python --force-reinstall --upgrade --no-cache-dir")
-    print("For GPU support (Metal/Mac): CMAKE_ARGS=\"-DLLAMA_METAL=on\" pip install llama-cpp-python --force-reinstall --upgrade --no-cache-dir")
-    sys.exit(1)
+    orjson = None
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Default socket used by --serve / --client
+DEFAULT_SOCKET_PATH = "/tmp/gguf_runner.sock"
+
+# Client socket timeouts (seconds): reaching the server, then waiting for each token
+CLIENT_CONNECT_TIMEOUT = 5
+CLIENT_READ_TIMEOUT = 300
+
+# Streamed tokens written to stdout between flushes
+STREAM_FLUSH_EVERY = 8
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to a JSON string, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode('utf-8')
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def _json_loads(data):
+    """Parse a JSON string or bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _import_llama_cpp():
+    """
+    Import llama_cpp on first use
+    
+    Loading llama_cpp initializes the GPU backends, which takes seconds, so it
+    is deferred until a model is actually loaded (--help, --save-config and
+    --client never pay for it).
+    """
+    try:
+        import llama_cpp
+    except ImportError:
+        print("Error: llama-cpp-python not installed.")
+        print("Install it with: pip install llama-cpp-python")
+        print("For GPU support (CUDA): CMAKE_ARGS=\"-DLLAMA_CUBLAS=on -DLLAMA_CUDA_F16=on\" pip install llama-cpp-python --force-reinstall --upgrade --no-cache-dir")
+        print("For GPU support (Metal/Mac): CMAKE_ARGS=\"-DLLAMA_METAL=on\" pip install llama-cpp-python --force-reinstall --upgrade --no-cache-dir")
+        raise
+    return llama_cpp
+
+
+def _resolve_ggml_type(llama_cpp, value):
+    """
+    Map a KV cache type name such as 'q8_0' to its GGML enum value
+    
+    Returns None when the installed llama-cpp-python does not know the type
+    (older releases predate KV cache quantization).
+    """
+    if isinstance(value, int):
+        return value
+    return getattr(llama_cpp, f"GGML_TYPE_{str(value).upper()}", None)
+
 
 class GGUFModelRunner:
     """Main class for running GGUF models with customizable parameters"""
@@ -60,7 +114,11 @@ class GGUFModelRunner:
         
         if not model_file.exists():
             # Try to find any GGUF file in the folder
-            gguf_files = list(model_folder.glob("*.gguf"))
+            with os.scandir(model_folder) as entries:
+                gguf_files = sorted(
+                    Path(entry.path) for entry in entries
+                    if entry.name.endswith('.gguf') and entry.is_file()
+                )
             if not gguf_files:
                 raise FileNotFoundError(f"No GGUF models found in '{model_folder}'")
             
@@ -79,33 +137,96 @@ class GGUFModelRunner:
         
         self.model_path = str(model_file)
         logger.info(f"Loading model: {model_file.name}")
+        llama_cpp = _import_llama_cpp()
         
         # Prepare model parameters
         model_params = {
             'model_path': self.model_path,
             'n_ctx': self.config['context_length'],
             'n_threads': self.config['cpu_threads'],
+            'n_threads_batch': self.config['cpu_threads_batch'],
             'n_batch': self.config['batch_size'],
             'use_mmap': self.config['use_mmap'],
             'use_mlock': self.config['use_mlock'],
             'verbose': self.config['verbose']
         }
         
-        # Add GPU offloading if configured
-        if self.config['gpu_layers'] > 0:
-            model_params['n_gpu_layers'] = self.config['gpu_layers']
-            logger.info(f"GPU offloading enabled: {self.config['gpu_layers']} layers")
+        # GPU kernel options (flash attention, multi-GPU split, KV cache types)
+        if self.config.get('flash_attn'):
+            model_params['flash_attn'] = True
+        if self.config.get('tensor_split'):
+            model_params['tensor_split'] = self.config['tensor_split']
+        if self.config.get('main_gpu'):
+            model_params['main_gpu'] = self.config['main_gpu']
+        for key in ('type_k', 'type_v'):
+            if self.config.get(key):
+                ggml_type = _resolve_ggml_type(llama_cpp, self.config[key])
+                if ggml_type is None:
+                    logger.warning(f"{key} '{self.config[key]}' is not supported by this llama-cpp-python; "
+                                   "keeping default cache type")
+                else:
+                    model_params[key] = ggml_type
+        
+        # llama.cpp can only quantize the V cache when flash attention is on
+        if 'type_v' in model_params and not model_params.get('flash_attn') \
+                and str(self.config['type_v']).lower() not in ('f16', 'f32'):
+            logger.warning(f"type_v '{self.config['type_v']}' requires flash_attn; keeping default V cache type")
+            del model_params['type_v']
+        if 'type_k' in model_params or 'type_v' in model_params:
+            logger.info(f"KV cache types: K={self.config['type_k'] if 'type_k' in model_params else 'f16'}, "
+                        f"V={self.config.get('type_v') if 'type_v' in model_params else 'f16'}")
+        
+        # GPU offloading: -1 = all layers, 0 = CPU only, N = first N layers
+        gpu_layers = self.config['gpu_layers']
+        model_params['n_gpu_layers'] = gpu_layers
+        if gpu_layers < 0:
+            logger.info("GPU offloading enabled: all layers")
+        elif gpu_layers > 0:
+            logger.info(f"GPU offloading enabled: {gpu_layers} layers")
         else:
-            model_params['n_gpu_layers'] = 0
             logger.info("Running on CPU only")
         
+        # Show backend capabilities (look for CUDA / BLAS = 1)
+        logger.info(f"llama.cpp system info: {llama_cpp.llama_print_system_info().decode('utf-8', 'ignore').strip()}")
+        
         # Initialize the model
         try:
-            self.model = Llama(**model_params)
+            self.model = llama_cpp.Llama(**model_params)
             logger.info("Model loaded successfully!")
         except Exception as e:
             logger.error(f"Failed to load model: {e}")
             raise
+        
+        # Prompt state cache: keeps KV states of several earlier prompts (llama.cpp
+        # already reuses the prefix shared with the previous call on its own)
+        cache_gb = self.config.get('cache_capacity_gb') or 0
+        if cache_gb > 0:
+            capacity_bytes = int(cache_gb * 1024 ** 3)
+            if self.config.get('prompt_cache') == 'disk':
+                # Persisted across runs, keyed so a different model/setup never reuses it
+                cache_dir = Path(self.config['cache_dir']).expanduser() / self._state_cache_key(model_params)
+                self.model.set_cache(llama_cpp.LlamaDiskCache(cache_dir=str(cache_dir), capacity_bytes=capacity_bytes))
+                logger.info(f"Disk prompt cache enabled: {cache_dir} ({cache_gb} GB)")
+            else:
+                self.model.set_cache(llama_cpp.LlamaRAMCache(capacity_bytes=capacity_bytes))
+                logger.info(f"Prompt cache enabled: {cache_gb} GB")
+        
+        # Sanity check: confirm what llama.cpp actually accepted
+        try:
+            offloaded = self.model.model_params.n_gpu_layers
+            if gpu_layers != 0 and offloaded == 0:
+                logger.warning("GPU offloading requested but model was loaded on CPU only")
+            else:
+                logger.info(f"llama.cpp n_gpu_layers: {offloaded}")
+        except AttributeError:
+            pass
+    
+    def _state_cache_key(self, model_params: Dict[str, Any]) -> str:
+        """Key identifying saved prompt states valid for this model file and setup"""
+        key = (f"{self.model_path}:{os.path.getmtime(self.model_path)}:"
+               f"{model_params['n_ctx']}:{model_params['n_gpu_layers']}:"
+               f"{model_params.get('type_k')}:{model_params.get('type_v')}")
+        return hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
     
     def generate(self, 
                  prompt: str,
@@ -114,7 +235,8 @@ class GGUFModelRunner:
                  top_p: Optional[float] = None,
                  top_k: Optional[int] = None,
                  repeat_penalty: Optional[float] = None,
-                 stream: Optional[bool] = None) -> str:
+                 stream: Optional[bool] = None,
+                 on_token: Optional[Callable[[str], None]] = None) -> str:
         """
         Generate text from a prompt
         
@@ -126,6 +248,7 @@ class GGUFModelRunner:
             top_k: Top-k sampling parameter
             repeat_penalty: Repetition penalty
             stream: Whether to stream output
+            on_token: Optional callback receiving each streamed token (defaults to printing)
             
         Returns:
             Generated text
@@ -150,13 +273,8 @@ class GGUFModelRunner:
         if stream:
             # Stream the output
             response = self.model(**generation_params, stream=True)
-            full_response = ""
-            for chunk in response:
-                text = chunk['choices'][0]['text']
-                print(text, end='', flush=True)
-                full_response += text
-            print()  # New line at the end
-            return full_response
+            texts = (chunk['choices'][0]['text'] for chunk in response)
+            return self._consume_stream(texts, on_token)
         else:
             # Return complete response
             response = self.model(**generation_params)
@@ -166,7 +284,8 @@ class GGUFModelRunner:
              messages: list,
              max_tokens: Optional[int] = None,
              temperature: Optional[float] = None,
-             stream: Optional[bool] = None) -> str:
+             stream: Optional[bool] = None,
+             on_token: Optional[Callable[[str], None]] = None) -> str:
         """
         Chat completion with message history
         
@@ -175,6 +294,7 @@ class GGUFModelRunner:
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature
             stream: Whether to stream output
+            on_token: Optional callback receiving each streamed token (defaults to printing)
             
         Returns:
             Generated response
@@ -196,18 +316,126 @@ class GGUFModelRunner:
         
         if stream:
             response = self.model.create_chat_completion(**generation_params, stream=True)
-            full_response = ""
-            for chunk in response:
-                if 'content' in chunk['choices'][0]['delta']:
-                    text = chunk['choices'][0]['delta']['content']
-                    print(text, end='', flush=True)
-                    full_response += text
-            print()
-            return full_response
+            texts = (
+                chunk['choices'][0]['delta']['content']
+                for chunk in response
+                if 'content' in chunk['choices'][0]['delta']
+            )
+            return self._consume_stream(texts, on_token)
         else:
             response = self.model.create_chat_completion(**generation_params)
             return response['choices'][0]['message']['content']
     
+    @staticmethod
+    def _consume_stream(texts, on_token: Optional[Callable[[str], None]] = None) -> str:
+        """
+        Drain streamed token texts, forwarding them to on_token or stdout
+        
+        Args:
+            texts: Iterable of streamed text pieces
+            on_token: Optional callback receiving each piece (defaults to stdout)
+            
+        Returns:
+            Full generated text
+        """
+        parts = []
+        if on_token:
+            for text in texts:
+                on_token(text)
+                parts.append(text)
+            return "".join(parts)
+        
+        # Flush stdout every few tokens rather than on every one
+        write = sys.stdout.write
+        for count, text in enumerate(texts, 1):
+            write(text)
+            parts.append(text)
+            if count % STREAM_FLUSH_EVERY == 0:
+                sys.stdout.flush()
+        write("\n")  # New line at the end
+        sys.stdout.flush()
+        return "".join(parts)
+    
+    def serve(self, socket_path: str = DEFAULT_SOCKET_PATH) -> None:
+        """
+        Keep the loaded model resident and answer prompts over a Unix socket
+        
+        Each client sends one JSON line with either 'prompt' or 'messages'
+        (plus optional 'max_tokens' / 'temperature'). Tokens are streamed back
+        as newline-delimited JSON objects, terminated by {"done": true}.
+        
+        Args:
+            socket_path: Filesystem path of the Unix domain socket
+        """
+        if not self.model:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+        if not hasattr(socket, 'AF_UNIX'):
+            raise RuntimeError("Server mode requires Unix domain socket support")
+        
+        if os.path.exists(socket_path):
+            # Only clear the path if it is a stale socket nobody answers on
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                try:
+                    probe.connect(socket_path)
+                except ConnectionRefusedError:
+                    os.remove(socket_path)
+                except FileNotFoundError:
+                    pass
+                else:
+                    raise RuntimeError(f"Another server is already listening on {socket_path}")
+        
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(socket_path)
+        server.listen(1)
+        logger.info(f"Serving model on {socket_path} (Ctrl+C to stop)")
+        
+        try:
+            while True:
+                conn, _ = server.accept()
+                with conn:
+                    self._handle_client(conn)
+        except KeyboardInterrupt:
+            logger.info("Server stopped")
+        finally:
+            server.close()
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+    
+    def _handle_client(self, conn: socket.socket) -> None:
+        """Serve a single client request on an accepted connection"""
+        def send(obj):
+            conn.sendall((_json_dumps(obj) + "\n").encode('utf-8'))
+        
+        try:
+            with conn.makefile('r', encoding='utf-8') as reader:
+                line = reader.readline()
+            if not line:
+                return  # Closed without a request (e.g. another serve() probing)
+            request = _json_loads(line)
+            
+            on_token = lambda text: send({"token": text})
+            if request.get('messages'):
+                self.chat(request['messages'],
+                          max_tokens=request.get('max_tokens'),
+                          temperature=request.get('temperature'),
+                          stream=True,
+                          on_token=on_token)
+            else:
+                self.generate(request.get('prompt', ''),
+                              max_tokens=request.get('max_tokens'),
+                              temperature=request.get('temperature'),
+                              stream=True,
+                              on_token=on_token)
+            send({"done": True})
+        except (BrokenPipeError, ConnectionResetError):
+            logger.warning("Client disconnected before response completed")
+        except Exception as e:
+            logger.error(f"Error serving request: {e}")
+            try:
+                send({"error": str(e)})
+            except OSError:
+                pass
+    
     def interactive_mode(self):
         """Run an interactive chat session"""
         print("\n" + "="*50)
@@ -239,8 +467,8 @@ class GGUFModelRunner:
                 if user_input.lower() == 'save':
                     filename = input("Enter filename to save (default: conversation.json): ").strip()
                     filename = filename or "conversation.json"
-                    with open(filename, 'w') as f:
-                        json.dump(messages, f, indent=2)
+                    with open(filename, 'w', encoding='utf-8') as f:
+                        f.write(_json_dumps(messages, indent=True))
                     print(f"Conversation saved to {filename}")
                     continue
                 
@@ -281,11 +509,22 @@ def load_config(config_file: Optional[str] = None) -> Dict[str, Any]:
         # Model loading parameters
         'context_length': 2048,
         'batch_size': 512,
-        'cpu_threads': 4,
+        'cpu_threads': 4,  # Decode threads (memory-bound, usually peaks at 4-8)
+        'cpu_threads_batch': os.cpu_count() or 4,  # Prompt prefill threads (compute-bound)
         'gpu_layers': -1,  # -1 for auto (all layers), 0 for CPU only, or specific number
         'use_mmap': True,
         'use_mlock': False,
         
+        # GPU kernel options
+        'flash_attn': True,
+        'tensor_split': None,  # e.g. [0.6, 0.4] to split layers across two GPUs
+        'main_gpu': 0,
+        'type_k': 'q8_0',  # KV cache key type: 'f16', 'q8_0' (near-lossless) or 'q4_0' (smaller, lossy at long context)
+        'type_v': 'q8_0',  # KV cache value type (quantized types need flash_attn)
+        'cache_capacity_gb': 0,  # Space for cached prompt states (0 disables)
+        'prompt_cache': 'ram',  # 'ram' (per process) or 'disk' (reused across runs)
+        'cache_dir': '~/.cache/cv-scanner',
+        
         # Generation parameters
         'max_tokens': 512,
         'temperature': 0.7,
@@ -303,8 +542,8 @@ def load_config(config_file: Optional[str] = None) -> Dict[str, Any]:
     
     if config_file and os.path.exists(config_file):
         logger.info(f"Loading configuration from {config_file}")
-        with open(config_file, 'r') as f:
-            user_config = json.load(f)
+        with open(config_file, 'rb') as f:
+            user_config = _json_loads(f.read())
         default_config.update(user_config)
     
     return default_config
@@ -312,11 +551,51 @@ def load_config(config_file: Optional[str] = None) -> Dict[str, Any]:
 
 def save_config(config: Dict[str, Any], filename: str = "config.json"):
     """Save configuration to a JSON file"""
-    with open(filename, 'w') as f:
-        json.dump(config, f, indent=2)
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write(_json_dumps(config, indent=True))
     logger.info(f"Configuration saved to {filename}")
 
 
+def run_client(prompt: str,
+               socket_path: str = DEFAULT_SOCKET_PATH,
+               max_tokens: Optional[int] = None,
+               temperature: Optional[float] = None) -> str:
+    """
+    Send a prompt to a running --serve instance and print the streamed reply
+    
+    Args:
+        prompt: Input text prompt
+        socket_path: Filesystem path of the server's Unix domain socket
+        max_tokens: Maximum tokens to generate (server config if omitted)
+        temperature: Sampling temperature (server config if omitted)
+        
+    Returns:
+        Generated text
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        raise RuntimeError("Client mode requires Unix domain socket support")
+    
+    request = {'prompt': prompt, 'max_tokens': max_tokens, 'temperature': temperature}
+    
+    def read_tokens(reader):
+        for line in reader:
+            message = _json_loads(line)
+            if 'error' in message:
+                raise RuntimeError(f"Server error: {message['error']}")
+            if message.get('done'):
+                return
+            yield message['token']
+    
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(CLIENT_CONNECT_TIMEOUT)
+        client.connect(socket_path)
+        client.settimeout(CLIENT_READ_TIMEOUT)
+        client.sendall((_json_dumps(request) + "\n").encode('utf-8'))
+        
+        with client.makefile('r', encoding='utf-8') as reader:
+            return GGUFModelRunner._consume_stream(read_tokens(reader))
+
+
 def main():
     parser = argparse.ArgumentParser(description='Run GGUF models with GPU offloading support')
     parser.add_argument('--model', '-m', type=str, help='Model filename in the model folder')
@@ -325,11 +604,15 @@ def main():
     parser.add_argument('--gpu-layers', '-g', type=int, help='Number of layers to offload to GPU')
     parser.add_argument('--ctx', type=int, help='Context length')
     parser.add_argument('--threads', '-t', type=int, help='Number of CPU threads')
+    parser.add_argument('--threads-batch', type=int, help='Number of CPU threads for prompt processing')
     parser.add_argument('--max-tokens', type=int, help='Maximum tokens to generate')
     parser.add_argument('--temperature', type=float, help='Sampling temperature')
     parser.add_argument('--interactive', '-i', action='store_true', help='Interactive mode')
     parser.add_argument('--save-config', action='store_true', help='Save current config to file')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
+    parser.add_argument('--serve', action='store_true', help='Keep the model loaded and serve prompts over a Unix socket')
+    parser.add_argument('--client', action='store_true', help='Send --prompt to a running --serve instance')
+    parser.add_argument('--socket', type=str, default=DEFAULT_SOCKET_PATH, help='Unix socket path for --serve/--client')
     
     args = parser.parse_args()
     
@@ -343,6 +626,8 @@ def main():
         config['context_length'] = args.ctx
     if args.threads:
         config['cpu_threads'] = args.threads
+    if args.threads_batch:
+        config['cpu_threads_batch'] = args.threads_batch
     if args.max_tokens:
         config['max_tokens'] = args.max_tokens
     if args.temperature:
@@ -354,6 +639,17 @@ def main():
     if args.save_config:
         save_config(config)
     
+    # Client mode talks to an already-loaded server, no local model needed
+    if args.client:
+        if not args.prompt:
+            parser.error("--client requires --prompt")
+        try:
+            run_client(args.prompt, args.socket, args.max_tokens, args.temperature)
+        except Exception as e:
+            logger.error(f"Client error: {e}")
+            sys.exit(1)
+        return
+    
     # Initialize runner
     runner = GGUFModelRunner(config)
     
@@ -361,7 +657,10 @@ def main():
         # Load model
         runner.load_model(args.model)
         
-        if args.prompt:
+        if args.serve:
+            # Daemon mode: model load cost is paid once for all clients
+            runner.serve(args.socket)
+        elif args.prompt:
             # Single generation mode
             print("\nGenerating response...")
             response = runner.generate(args.prompt)
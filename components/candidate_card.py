@@ -3,25 +3,65 @@ Candidate Card Component - Individual candidate result card
 """
 
 import customtkinter as ctk
-import os
 from .theme_manager import ThemeManager
+from .candidate_fields import get_display_name, get_score, get_score_text, get_category, get_skill_partition
+
+
+# (border_color, rank_bg) per recommendation tier: shortlist, review, other
+TIER_COLORS = (
+    (ThemeManager.COLORS["success"], ThemeManager.COLORS["success"]),
+    (ThemeManager.COLORS["info"], ThemeManager.COLORS["info"]),
+    (ThemeManager.COLORS["gray"], ThemeManager.COLORS["gray_dark"]),
+)
+
+# Tier (index into TIER_COLORS) for each cached filter category
+CATEGORY_TIERS = {"Shortlist": 0, "Review": 1, "Other": 2}
+
+
+def build_card_columns(candidates):
+    """
+    Precompute card display fields once for a list of candidates
+    
+    Returns parallel lists (one entry per candidate) so each card only
+    indexes primitives instead of re-deriving them from the result dict.
+    """
+    columns = {
+        "data": [],
+        "name": [],
+        "rec": [],
+        "tier": [],
+        "score": [],
+        "score_text": [],
+        "found_skills": [],
+    }
+    
+    for candidate in candidates:
+        rec = candidate.get("recommendation", "N/A")
+        tier = CATEGORY_TIERS[get_category(candidate)]
+        
+        name_text = get_display_name(candidate) or "Unknown"
+        if len(name_text) > 50:
+            name_text = name_text[:47] + "..."
+        
+        found_skills = [s["skill"] for s in get_skill_partition(candidate)[0][:3]]
+        
+        columns["data"].append(candidate)
+        columns["name"].append(name_text)
+        columns["rec"].append(rec)
+        columns["tier"].append(tier)
+        columns["score"].append(get_score(candidate))
+        columns["score_text"].append(get_score_text(candidate))
+        columns["found_skills"].append(found_skills)
+    
+    return columns
 
 
 class CandidateCard(ctk.CTkFrame):
     """Modern candidate card with score, recommendation, and details button"""
     
-    def __init__(self, parent, rank, candidate_data, on_details_callback):
-        # Determine colors based on recommendation
-        rec = candidate_data.get("recommendation", "").upper()
-        if "SHORTLIST" in rec:
-            border_color = ThemeManager.COLORS["success"]
-            rank_bg = ThemeManager.COLORS["success"]
-        elif "REVIEW" in rec:
-            border_color = ThemeManager.COLORS["info"]
-            rank_bg = ThemeManager.COLORS["info"]
-        else:
-            border_color = ThemeManager.COLORS["gray"]
-            rank_bg = ThemeManager.COLORS["gray_dark"]
+    def __init__(self, parent, rank, columns, on_details_callback):
+        # Colors come from the precomputed recommendation tier
+        border_color, rank_bg = TIER_COLORS[columns["tier"][rank]]
         
         super().__init__(
             parent,
@@ -31,11 +71,16 @@ class CandidateCard(ctk.CTkFrame):
             fg_color=("#ffffff", "#1e2433")
         )
         
-        self.candidate_data = candidate_data
+        self.columns = columns
+        self.index = rank
+        self.candidate_data = columns["data"][rank]
         self.on_details_callback = on_details_callback
         self.border_color = border_color
         self.rank_bg = rank_bg
         
+        # Grid row assigned by the results panel (None while hidden)
+        self._row = None
+        
         self.grid_columnconfigure(1, weight=1)
         
         self._create_rank_badge(rank)
@@ -43,20 +88,78 @@ class CandidateCard(ctk.CTkFrame):
         self._create_score_section()
         self._create_skills_section()
         self._create_details_button()
+        
+        # Options last applied to each widget, so updates skip unchanged ones
+        self._shown = self._widget_options(rank)
+        self._shown_skills = columns["found_skills"][rank]
+    
+    def _widget_options(self, rank):
+        """Options each per-candidate widget shows for the candidate at rank, keyed by attribute name"""
+        columns = self.columns
+        return {
+            "rank_label": {"text": f"#{rank + 1}"},
+            "name_label": {"text": columns["name"][rank]},
+            "score_label": {"text": columns["score_text"][rank]},
+            "score_bar": {"width": self._bar_width(columns["score"][rank])},
+            "rec_badge": {"text": columns["rec"][rank]},
+        }
+    
+    def update_candidate(self, rank, columns):
+        """
+        Show a different candidate in this card, reconfiguring existing widgets
+        
+        Args:
+            rank: Index of the candidate in columns
+            columns: Card columns from build_card_columns()
+        """
+        self.columns = columns
+        self.index = rank
+        self.candidate_data = columns["data"][rank]
+        
+        border_color, rank_bg = TIER_COLORS[columns["tier"][rank]]
+        if border_color != self.border_color:
+            self.border_color = border_color
+            self.configure(border_color=border_color)
+            self.score_bar.configure(fg_color=border_color)
+            self.rec_badge.configure(fg_color=border_color)
+            self.details_btn.configure(
+                border_color=border_color,
+                text_color=border_color,
+                hover_color=border_color
+            )
+        if rank_bg != self.rank_bg:
+            self.rank_bg = rank_bg
+            self.rank_label.configure(fg_color=rank_bg)
+        
+        # Only reconfigure widgets whose text or size actually changed
+        for name, options in self._widget_options(rank).items():
+            if self._shown[name] != options:
+                self._shown[name] = options
+                getattr(self, name).configure(**options)
+        
+        found_skills = columns["found_skills"][rank]
+        if found_skills != self._shown_skills:
+            self._shown_skills = found_skills
+            self._update_skill_tags()
+    
+    @staticmethod
+    def _bar_width(score_num):
+        """Width in pixels of the score bar for a 0-100 score"""
+        return max(0, int((score_num / 100) * 150))
     
     def _create_rank_badge(self, rank):
         """Create rank badge"""
-        rank_label = ctk.CTkLabel(
+        self.rank_label = ctk.CTkLabel(
             self,
             text=f"#{rank + 1}",
-            font=ctk.CTkFont(size=22, weight="bold"),
+            font=ThemeManager.get_font("badge"),
             width=60,
             height=60,
             fg_color=self.rank_bg,
             corner_radius=10,
             text_color="#ffffff"
         )
-        rank_label.grid(row=0, column=0, rowspan=2, padx=15, pady=15, sticky="n")
+        self.rank_label.grid(row=0, column=0, rowspan=2, padx=15, pady=15, sticky="n")
     
     def _create_info_section(self):
         """Create name and basic info"""
@@ -65,17 +168,13 @@ class CandidateCard(ctk.CTkFrame):
         info_frame.grid_columnconfigure(0, weight=1)
         
         # Name
-        name_text = os.path.basename(self.candidate_data.get("cv_file", "Unknown"))
-        if len(name_text) > 50:
-            name_text = name_text[:47] + "..."
-        
-        name_label = ctk.CTkLabel(
+        self.name_label = ctk.CTkLabel(
             info_frame,
-            text=name_text,
+            text=self.columns["name"][self.index],
             font=ThemeManager.get_font("subheading"),
             anchor="w"
         )
-        name_label.grid(row=0, column=0, sticky="w")
+        self.name_label.grid(row=0, column=0, sticky="w")
     
     def _create_score_section(self):
         """Create score bar and recommendation badge"""
@@ -83,24 +182,19 @@ class CandidateCard(ctk.CTkFrame):
         score_frame.grid(row=1, column=1, padx=(0, 10), pady=(0, 15), sticky="w")
         
         # Score
-        fit_score_value = self.candidate_data.get("fit_score", 0)
-        try:
-            score_num = float(fit_score_value)
-            score_text = f"Match: {score_num:.0f}%"
-        except:
-            score_num = 0
-            score_text = f"Match: {fit_score_value}"
+        score_num = self.columns["score"][self.index]
+        score_text = self.columns["score_text"][self.index]
         
         score_container = ctk.CTkFrame(score_frame, fg_color="transparent")
         score_container.grid(row=0, column=0, sticky="w")
         
-        score_label = ctk.CTkLabel(
+        self.score_label = ctk.CTkLabel(
             score_container,
             text=score_text,
             font=ThemeManager.get_font("body_bold"),
             anchor="w"
         )
-        score_label.pack(anchor="w", pady=(0, 3))
+        self.score_label.pack(anchor="w", pady=(0, 3))
         
         # Score bar
         score_bar_bg = ctk.CTkFrame(
@@ -112,23 +206,19 @@ class CandidateCard(ctk.CTkFrame):
         )
         score_bar_bg.pack(anchor="w")
         
-        try:
-            bar_width = int((score_num / 100) * 150)
-            score_bar = ctk.CTkFrame(
-                score_bar_bg,
-                height=6,
-                width=bar_width,
-                corner_radius=3,
-                fg_color=self.border_color
-            )
-            score_bar.place(x=0, y=0)
-        except:
-            pass
+        self.score_bar = ctk.CTkFrame(
+            score_bar_bg,
+            height=6,
+            width=self._bar_width(score_num),
+            corner_radius=3,
+            fg_color=self.border_color
+        )
+        self.score_bar.place(x=0, y=0)
         
         # Recommendation badge
-        rec_badge = ctk.CTkLabel(
+        self.rec_badge = ctk.CTkLabel(
             score_frame,
-            text=self.candidate_data.get("recommendation", "N/A"),
+            text=self.columns["rec"][self.index],
             font=ThemeManager.get_font("small_bold"),
             text_color="#ffffff",
             fg_color=self.border_color,
@@ -136,33 +226,49 @@ class CandidateCard(ctk.CTkFrame):
             padx=12,
             pady=6
         )
-        rec_badge.grid(row=0, column=1, padx=(15, 0))
+        self.rec_badge.grid(row=0, column=1, padx=(15, 0))
     
     def _create_skills_section(self):
         """Create skills tags if available"""
-        extracted = self.candidate_data.get("extracted_data", {})
-        if extracted.get("required_skills"):
-            found_skills = [s for s in extracted["required_skills"] if s.get("found")][:3]
-            if found_skills:
-                skills_frame = ctk.CTkFrame(self, fg_color="transparent")
-                skills_frame.grid(row=2, column=1, padx=(0, 10), pady=(0, 12), sticky="w")
-                
-                for idx, skill in enumerate(found_skills):
-                    skill_tag = ctk.CTkLabel(
-                        skills_frame,
-                        text=f"✓ {skill['skill'][:15]}",
-                        font=ThemeManager.get_font("tiny"),
-                        fg_color=("#e6ffed", "#1a3d2e"),
-                        text_color=("#22863a", "#56ab2f"),
-                        corner_radius=5,
-                        padx=8,
-                        pady=3
-                    )
-                    skill_tag.grid(row=0, column=idx, padx=(0, 5))
+        self.skills_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.skill_tags = []
+        self._update_skill_tags()
+    
+    def _update_skill_tags(self):
+        """Show the current candidate's found skills, reusing existing tags"""
+        found_skills = self.columns["found_skills"][self.index]
+        if not found_skills:
+            self.skills_frame.grid_remove()
+            return
+        
+        for idx, skill in enumerate(found_skills):
+            text = f"✓ {skill[:15]}"
+            if idx < len(self.skill_tags):
+                self.skill_tags[idx].configure(text=text)
+                self.skill_tags[idx].grid()
+            else:
+                skill_tag = ctk.CTkLabel(
+                    self.skills_frame,
+                    text=text,
+                    font=ThemeManager.get_font("tiny"),
+                    fg_color=("#e6ffed", "#1a3d2e"),
+                    text_color=("#22863a", "#56ab2f"),
+                    corner_radius=5,
+                    padx=8,
+                    pady=3
+                )
+                skill_tag.grid(row=0, column=idx, padx=(0, 5))
+                self.skill_tags.append(skill_tag)
+        
+        # Hide tags left over from a candidate with more skills
+        for skill_tag in self.skill_tags[len(found_skills):]:
+            skill_tag.grid_remove()
+        
+        self.skills_frame.grid(row=2, column=1, padx=(0, 10), pady=(0, 12), sticky="w")
     
     def _create_details_button(self):
         """Create view details button"""
-        details_btn = ctk.CTkButton(
+        self.details_btn = ctk.CTkButton(
             self,
             text="View Details →",
             command=lambda: self.on_details_callback(self.candidate_data),
@@ -176,4 +282,4 @@ class CandidateCard(ctk.CTkFrame):
             text_color=self.border_color,
             hover_color=self.border_color
         )
-        details_btn.grid(row=1, column=2, rowspan=2, padx=(0, 15), pady=(0, 15), sticky="e")
+        self.details_btn.grid(row=1, column=2, rowspan=2, padx=(0, 15), pady=(0, 15), sticky="e")
@@ -0,0 +1,136 @@
+"""
+Candidate Fields - Derived values computed once per candidate result
+
+Cached values are stored on the candidate dict under keys starting with
+an underscore so every component reuses them; strip them before export.
+"""
+
+import os
+
+
+def get_display_name(candidate_data):
+    """Return the CV file's base name, computed once per candidate"""
+    name = candidate_data.get("_basename")
+    if name is None:
+        name = candidate_data["_basename"] = os.path.basename(candidate_data.get("cv_file", ""))
+    return name
+
+
+def get_search_name(candidate_data):
+    """Return the lower-cased display name used by search, computed once per candidate"""
+    name = candidate_data.get("_name_lc")
+    if name is None:
+        name = candidate_data["_name_lc"] = get_display_name(candidate_data).lower()
+    return name
+
+
+def get_score(candidate_data):
+    """Return fit_score as a float (0 if it is not a number), computed once per candidate"""
+    score = candidate_data.get("_score")
+    if score is None:
+        try:
+            score = float(candidate_data.get("fit_score", 0) or 0)
+        except (TypeError, ValueError):
+            score = 0.0
+        candidate_data["_score"] = score
+    return score
+
+
+def get_score_text(candidate_data):
+    """Return the card's "Match: N%" label text, computed once per candidate"""
+    text = candidate_data.get("_score_text")
+    if text is None:
+        fit_score = candidate_data.get("fit_score", 0)
+        try:
+            text = f"Match: {float(fit_score):.0f}%"
+        except (TypeError, ValueError):
+            text = f"Match: {fit_score}"
+        candidate_data["_score_text"] = text
+    return text
+
+
+def get_category(candidate_data):
+    """Return the filter category ("Shortlist", "Review" or "Other"), computed once per candidate"""
+    category = candidate_data.get("_category")
+    if category is None:
+        rec = candidate_data.get("recommendation", "").upper()
+        category = "Shortlist" if "SHORTLIST" in rec else "Review" if "REVIEW" in rec else "Other"
+        candidate_data["_category"] = category
+    return category
+
+
+def get_joined_list(candidate_data, key):
+    """Return candidate_data[key] joined with ", ", computed once per candidate"""
+    cache_key = "_joined_" + key
+    joined = candidate_data.get(cache_key)
+    if joined is None:
+        joined = candidate_data[cache_key] = ", ".join(candidate_data.get(key, ()))
+    return joined
+
+
+def partition_skills(skills):
+    """Split a skills list into (found, missing) in a single pass"""
+    found = []
+    missing = []
+    for skill in skills:
+        (found if skill.get("found") else missing).append(skill)
+    return found, missing
+
+
+def get_skill_partition(candidate_data):
+    """Return the (found, missing) required skills, computed once per candidate"""
+    if "_found_skills" not in candidate_data:
+        required = candidate_data.get("extracted_data", {}).get("required_skills") or []
+        candidate_data["_found_skills"], candidate_data["_missing_skills"] = partition_skills(required)
+    return candidate_data["_found_skills"], candidate_data["_missing_skills"]
+
+
+def get_detail_texts(candidate_data):
+    """
+    Return the details view's section texts keyed by section, computed once per candidate
+    
+    Sections with nothing to show are left out.
+    """
+    texts = candidate_data.get("_detail_texts")
+    if texts is not None:
+        return texts
+    
+    texts = {}
+    if candidate_data.get("summary"):
+        texts["summary"] = candidate_data["summary"]
+    if candidate_data.get("breakdown"):
+        texts["breakdown"] = "\n".join(candidate_data["breakdown"])
+    
+    extracted = candidate_data.get("extracted_data", {})
+    if extracted.get("required_skills"):
+        found_skills, missing_skills = get_skill_partition(candidate_data)
+        if found_skills:
+            texts["found_skills"] = "\n".join(
+                f"✓ {s['skill']}: {s.get('evidence', 'N/A')[:100]}..."
+                for s in found_skills
+            )
+        if missing_skills:
+            texts["missing_skills"] = "\n".join(f"✗ {s['skill']}" for s in missing_skills)
+    
+    if extracted.get("projects"):
+        texts["projects"] = "\n\n".join(
+            f"• {p.get('title', 'Unnamed')}\n"
+            f"  Relevance: {p.get('relevance', 'N/A')}\n"
+            f"  Technologies: {', '.join(p.get('technologies', []))}\n"
+            f"  Deployed: {'Yes ✓' if p.get('deployment_proof') else 'No'}"
+            for p in extracted["projects"][:5]
+        )
+    
+    if extracted.get("issues"):
+        texts["issues"] = "\n".join(
+            f"• [{i.get('type', 'N/A')}] {i.get('description', 'N/A')}"
+            for i in extracted["issues"]
+        )
+    
+    candidate_data["_detail_texts"] = texts
+    return texts
+
+
+def strip_cached_fields(candidate_data):
+    """Return a copy of the candidate without cached (underscore) fields"""
+    return {k: v for k, v in candidate_data.items() if not k.startswith("_")}
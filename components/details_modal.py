@@ -3,37 +3,111 @@ Details Modal Component - Detailed candidate analysis view
 """
 
 import customtkinter as ctk
-import os
+from tkinter import TclError
 from .theme_manager import ThemeManager
+from .candidate_fields import get_display_name, get_detail_texts
+
+
+# Longest the window stays topmost if it never receives focus
+TOPMOST_FALLBACK_MS = 1000
+
+# Details sections in display order: (text key, title, accent color name)
+DETAIL_SECTIONS = (
+    ("summary", "📋 Overall Summary", None),
+    ("breakdown", "📊 Score Breakdown", "primary"),
+    ("found_skills", "✨ Required Skills Found", "success"),
+    ("missing_skills", "⚠️ Missing Required Skills", "danger"),
+    ("projects", "🚀 Projects", "info"),
+    ("issues", "⚡ Issues Detected", "warning"),
+)
 
 
 class DetailsModal(ctk.CTkToplevel):
-    """Modal window for displaying detailed candidate analysis"""
+    """
+    Modal window for displaying detailed candidate analysis
+    
+    The window is built once and reused: closing it only hides it, and
+    show_candidate() refills the existing widgets for another candidate.
+    """
     
     def __init__(self, parent, candidate_data):
         super().__init__(parent)
         
+        # Stay hidden while the widget tree is built so it appears fully formed
+        self.withdraw()
+        
+        self.parent = parent
         self.candidate_data = candidate_data
         
+        # Section widgets keyed by DETAIL_SECTIONS key: (frame, textbox), created on first use
+        self._sections = {}
+        
+        # Drop "-topmost" once the window has focus (<FocusIn> binding),
+        # or after TOPMOST_FALLBACK_MS if focus never arrives (timer)
+        self._topmost_binding = None
+        self._topmost_job = None
+        
         # Window configuration
-        self.title(f"Analysis Details - {os.path.basename(candidate_data.get('cv_file', ''))}")
         self.geometry("900x950")
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
+        self.protocol("WM_DELETE_WINDOW", self.withdraw)
+        
+        self._create_header()
+        self._create_content()
+        self._create_footer()
+        
+        self.show_candidate(candidate_data)
+    
+    def show_candidate(self, candidate_data):
+        """Show a candidate's details in the existing widgets and bring the window up"""
+        self.candidate_data = candidate_data
+        
+        self.title(f"Analysis Details - {get_display_name(candidate_data)}")
+        self.title_label.configure(text=get_display_name(candidate_data) or "Unknown")
+        self.score_label.configure(
+            text=f"🎯 Match Score: {candidate_data.get('fit_score', 'N/A')}%  •  {candidate_data.get('recommendation', '')}"
+        )
+        self._show_sections()
+        
+        # Start each candidate at the top of the content
+        try:
+            self.content_frame._parent_canvas.yview_moveto(0)
+        except (AttributeError, TclError):
+            pass
         
-        # Window behavior
+        # Window manager calls run once, after the content is in place
+        self.after_idle(self._raise_window)
+    
+    def _raise_window(self):
+        """Show the window and bring it to the front"""
         try:
-            self.transient(parent)
+            self.transient(self.parent)
+            self.deiconify()
             self.lift()
+            # Stay on top until the window receives focus, or the fallback timer fires
             self.attributes("-topmost", True)
-            self.focus_force()
-            self.after(200, lambda: self.attributes("-topmost", False))
-        except:
+            if self._topmost_binding is None:
+                self._topmost_binding = self.bind("<FocusIn>", self._release_topmost, add="+")
+            if self._topmost_job is not None:
+                self.after_cancel(self._topmost_job)
+            self._topmost_job = self.after(TOPMOST_FALLBACK_MS, self._release_topmost)
+            self.focus_set()
+        except TclError:
             pass
-        
-        self._create_header()
-        self._create_content()
-        self._create_footer()
+    
+    def _release_topmost(self, event=None):
+        """Stop keeping the window on top (on first focus or the fallback timer, whichever comes first)"""
+        try:
+            if self._topmost_job is not None:
+                self.after_cancel(self._topmost_job)
+            self.attributes("-topmost", False)
+            if self._topmost_binding is not None:
+                self.unbind("<FocusIn>", self._topmost_binding)
+        except TclError:
+            pass
+        self._topmost_job = None
+        self._topmost_binding = None
     
     def _create_header(self):
         """Create header with candidate info"""
@@ -47,24 +121,23 @@ class DetailsModal(ctk.CTkToplevel):
         header_frame.grid_columnconfigure(0, weight=1)
         header_frame.grid_propagate(False)
         
-        # Title
-        title_label = ctk.CTkLabel(
+        # Title (text set by show_candidate)
+        self.title_label = ctk.CTkLabel(
             header_frame,
-            text=os.path.basename(self.candidate_data.get("cv_file", "Unknown")),
-            font=ctk.CTkFont(size=22, weight="bold"),
+            text="",
+            font=ThemeManager.get_font("badge"),
             text_color="#ffffff"
         )
-        title_label.grid(row=0, column=0, padx=30, pady=(25, 5), sticky="w")
+        self.title_label.grid(row=0, column=0, padx=30, pady=(25, 5), sticky="w")
         
-        # Score
-        score_text = f"🎯 Match Score: {self.candidate_data.get('fit_score', 'N/A')}%  •  {self.candidate_data.get('recommendation', '')}"
-        score_label = ctk.CTkLabel(
+        # Score (text set by show_candidate)
+        self.score_label = ctk.CTkLabel(
             header_frame,
-            text=score_text,
+            text="",
             font=ThemeManager.get_font("body"),
             text_color="#ffffff"
         )
-        score_label.grid(row=1, column=0, padx=30, pady=(0, 25), sticky="w")
+        self.score_label.grid(row=1, column=0, padx=30, pady=(0, 25), sticky="w")
         
         # Copy button
         copy_btn = ctk.CTkButton(
@@ -82,112 +155,52 @@ class DetailsModal(ctk.CTkToplevel):
         copy_btn.grid(row=0, column=1, rowspan=2, padx=30, pady=25, sticky="e")
     
     def _create_content(self):
-        """Create scrollable content area"""
-        content_frame = ctk.CTkScrollableFrame(self, fg_color="transparent")
-        content_frame.grid(row=1, column=0, sticky="nsew", padx=25, pady=25)
-        content_frame.grid_columnconfigure(0, weight=1)
-        
-        row_idx = 0
-        
-        # Summary
-        if self.candidate_data.get("summary"):
-            self._add_section(
-                content_frame,
-                row_idx,
-                "📋 Overall Summary",
-                self.candidate_data["summary"]
-            )
-            row_idx += 1
-        
-        # Score breakdown
-        if self.candidate_data.get("breakdown"):
-            breakdown_text = "\n".join(self.candidate_data["breakdown"])
-            self._add_section(
-                content_frame,
-                row_idx,
-                "📊 Score Breakdown",
-                breakdown_text,
-                ThemeManager.COLORS["primary"]
-            )
-            row_idx += 1
-        
-        # Skills analysis
-        extracted = self.candidate_data.get("extracted_data", {})
-        if extracted.get("required_skills"):
-            found_skills = [s for s in extracted["required_skills"] if s.get("found")]
-            missing_skills = [s for s in extracted["required_skills"] if not s.get("found")]
+        """Create scrollable content area (sections are filled by show_candidate)"""
+        self.content_frame = ctk.CTkScrollableFrame(self, fg_color="transparent")
+        self.content_frame.grid(row=1, column=0, sticky="nsew", padx=25, pady=25)
+        self.content_frame.grid_columnconfigure(0, weight=1)
+    
+    def _show_sections(self):
+        """Show the current candidate's sections, reusing section widgets and hiding empty ones"""
+        # Section texts are formatted once per candidate (usually on the analysis thread)
+        texts = get_detail_texts(self.candidate_data)
+        for row_idx, (key, title, accent) in enumerate(DETAIL_SECTIONS):
+            section = self._sections.get(key)
+            if key not in texts:
+                if section:
+                    section[0].grid_remove()
+                continue
             
-            if found_skills:
-                skills_text = "\n".join([
-                    f"✓ {s['skill']}: {s.get('evidence', 'N/A')[:100]}..."
-                    for s in found_skills
-                ])
-                self._add_section(
-                    content_frame,
+            if section is None:
+                section = self._sections[key] = self._add_section(
+                    self.content_frame,
                     row_idx,
-                    "✨ Required Skills Found",
-                    skills_text,
-                    ThemeManager.COLORS["success"]
+                    title,
+                    ThemeManager.COLORS[accent] if accent else None
                 )
-                row_idx += 1
+            else:
+                section[0].grid()
             
-            if missing_skills:
-                missing_text = "\n".join([f"✗ {s['skill']}" for s in missing_skills])
-                self._add_section(
-                    content_frame,
-                    row_idx,
-                    "⚠️ Missing Required Skills",
-                    missing_text,
-                    ThemeManager.COLORS["danger"]
-                )
-                row_idx += 1
-        
-        # Projects
-        if extracted.get("projects"):
-            projects_text = "\n\n".join([
-                f"• {p.get('title', 'Unnamed')}\n"
-                f"  Relevance: {p.get('relevance', 'N/A')}\n"
-                f"  Technologies: {', '.join(p.get('technologies', []))}\n"
-                f"  Deployed: {'Yes ✓' if p.get('deployment_proof') else 'No'}"
-                for p in extracted["projects"][:5]
-            ])
-            self._add_section(
-                content_frame,
-                row_idx,
-                "🚀 Projects",
-                projects_text,
-                ThemeManager.COLORS["info"]
-            )
-            row_idx += 1
-        
-        # Issues
-        if extracted.get("issues"):
-            issues_text = "\n".join([
-                f"• [{i.get('type', 'N/A')}] {i.get('description', 'N/A')}"
-                for i in extracted["issues"]
-            ])
-            self._add_section(
-                content_frame,
-                row_idx,
-                "⚡ Issues Detected",
-                issues_text,
-                ThemeManager.COLORS["warning"]
-            )
+            content_box = section[1]
+            content_box.configure(state="normal")
+            content_box.delete("1.0", "end")
+            content_box.insert("1.0", texts[key])
+            content_box.configure(state="disabled")
     
     def _create_footer(self):
         """Create footer with close button"""
         close_btn = ctk.CTkButton(
             self,
             text="Close",
-            command=self.destroy,
+            command=self.withdraw,
             height=45,
             font=ThemeManager.get_font("body_bold"),
             **ThemeManager.get_button_style("primary")
         )
         close_btn.grid(row=2, column=0, padx=25, pady=(0, 25), sticky="ew")
     
-    def _add_section(self, parent, row, title, content, accent_color=None):
-        """Add a styled section"""
+    def _add_section(self, parent, row, title, accent_color=None):
+        """Add a styled, empty section; returns (section_frame, content_box)"""
         section_frame = ctk.CTkFrame(
             parent,
             corner_radius=12,
@@ -215,13 +228,12 @@ class DetailsModal(ctk.CTkToplevel):
             corner_radius=8
         )
         content_box.grid(row=1, column=0, padx=20, pady=(0, 15), sticky="ew")
-        content_box.insert("1.0", content)
-        content_box.configure(state="disabled")
+        return section_frame, content_box
     
     def _copy_to_clipboard(self):
         """Copy candidate details to clipboard"""
         try:
-            text = f"CV: {os.path.basename(self.candidate_data.get('cv_file', ''))}\n"
+            text = f"CV: {get_display_name(self.candidate_data)}\n"
             text += f"Score: {self.candidate_data.get('fit_score', '')}%\n"
             text += f"Recommendation: {self.candidate_data.get('recommendation', '')}\n\n"
             text += f"Summary:\n{self.candidate_data.get('summary', '')}\n"
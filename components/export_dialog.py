@@ -4,11 +4,70 @@ Export Dialog Component - Export results to multiple formats
 
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
-import os
 import json
 import csv
+import io
+import queue
+import threading
+import importlib.util
 from datetime import datetime
 from .theme_manager import ThemeManager
+from .candidate_fields import get_display_name, get_joined_list, strip_cached_fields
+
+# Optional fast JSON serializer
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Above this many rows CSV is streamed to disk instead of built in memory
+CSV_IN_MEMORY_MAX_ROWS = 100_000
+
+# How often the Tk thread checks for a finished background export
+EXPORT_POLL_MS = 50
+
+EXPORT_HEADERS = ["Rank", "CV File", "Fit Score", "Recommendation", "Skills", "Experience"]
+
+
+def _candidate_row(rank, candidate):
+    """Build one tabular export row (shared by CSV and Excel writers)"""
+    get = candidate.get
+    return [
+        rank,
+        get_display_name(candidate),
+        get("fit_score", ""),
+        get("recommendation", ""),
+        get_joined_list(candidate, "skills"),
+        get_joined_list(candidate, "experience")
+    ]
+
+
+def _dumps(obj):
+    """Serialize obj to compact UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+def _write_json_stream(filename, envelope, items_key, items):
+    """
+    Write {**envelope, items_key: [...]} one item at a time
+    
+    Only a single item is serialized in memory at once, so exports of any
+    size have flat memory use and the file starts filling immediately.
+    """
+    with open(filename, 'wb', buffering=1 << 20) as f:
+        f.write(b'{\n')
+        for key, value in envelope.items():
+            f.write(b'  ' + _dumps(key) + b': ' + _dumps(value) + b',\n')
+        f.write(b'  ' + _dumps(items_key) + b': [')
+        
+        separator = b'\n    '
+        for item in items:
+            f.write(separator + _dumps(item))
+            separator = b',\n    '
+        f.write(b'\n  ]\n}\n')
 
 
 class ExportDialog(ctk.CTkToplevel):
@@ -20,11 +79,16 @@ class ExportDialog(ctk.CTkToplevel):
         self.candidates = candidates
         self.stats = stats
         
+        # Outcome of the running background export, handed to the Tk thread
+        self._export_results = queue.SimpleQueue()
+        self._exporting = False
+        
         # Window configuration
         self.title("Export Results")
-        self.geometry("500x500")
+        self.geometry("500x570")
         self.transient(parent)
         self.grab_set()
+        self.protocol("WM_DELETE_WINDOW", self._close)
         
         # Center the window
         self.update_idletasks()
@@ -69,6 +133,7 @@ class ExportDialog(ctk.CTkToplevel):
             **ThemeManager.get_button_style("success")
         )
         csv_btn.pack(pady=8, fill="x")
+        self.export_buttons = [csv_btn]
         
         # JSON button
         json_btn = ctk.CTkButton(
@@ -83,6 +148,22 @@ class ExportDialog(ctk.CTkToplevel):
             text_color="#ffffff"
         )
         json_btn.pack(pady=8, fill="x")
+        self.export_buttons.append(json_btn)
+        
+        # JSON Lines button
+        jsonl_btn = ctk.CTkButton(
+            options_frame,
+            text="🧾 Export as JSON Lines",
+            command=self._export_jsonl,
+            height=50,
+            font=ThemeManager.get_font("body_bold"),
+            corner_radius=10,
+            fg_color=ThemeManager.COLORS["info"],
+            hover_color=ThemeManager.COLORS["info_dark"],
+            text_color="#ffffff"
+        )
+        jsonl_btn.pack(pady=8, fill="x")
+        self.export_buttons.append(jsonl_btn)
         
         # Excel button
         excel_btn = ctk.CTkButton(
@@ -97,6 +178,7 @@ class ExportDialog(ctk.CTkToplevel):
             text_color="#ffffff"
         )
         excel_btn.pack(pady=8, fill="x")
+        self.export_buttons.append(excel_btn)
         
         # Plain Text button
         txt_btn = ctk.CTkButton(
@@ -111,12 +193,13 @@ class ExportDialog(ctk.CTkToplevel):
             text_color="#ffffff"
         )
         txt_btn.pack(pady=8, fill="x")
+        self.export_buttons.append(txt_btn)
         
         # Cancel button
-        cancel_btn = ctk.CTkButton(
+        self.cancel_btn = ctk.CTkButton(
             self,
             text="Cancel",
-            command=self.destroy,
+            command=self._close,
             height=40,
             font=ThemeManager.get_font("body"),
             corner_radius=10,
@@ -125,235 +208,284 @@ class ExportDialog(ctk.CTkToplevel):
             border_color=("#a0aec0", "#718096"),
             text_color=("#a0aec0", "#718096")
         )
-        cancel_btn.pack(pady=(5, 20), padx=30, fill="x")
+        self.cancel_btn.pack(pady=(5, 20), padx=30, fill="x")
     
-    def _export_csv(self):
-        """Export results to CSV"""
+    def _close(self):
+        """Close the dialog, unless an export is still writing"""
+        if not self._exporting:
+            self.destroy()
+    
+    def _set_busy(self, busy):
+        """Disable the format and cancel buttons while an export runs"""
+        self._exporting = busy
+        state = "disabled" if busy else "normal"
+        for button in self.export_buttons:
+            button.configure(state=state)
+        self.cancel_btn.configure(state=state)
+    
+    def _ask_filename(self, extension, type_label):
+        """Ask for an output path, or return None if there is nothing to export"""
         if not self.candidates:
             messagebox.showwarning("No Data", "No analysis data available to export.")
             self.destroy()
-            return
+            return None
         
-        filename = filedialog.asksaveasfilename(
-            defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
-            initialfile=f"cv_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        )
+        return filedialog.asksaveasfilename(
+            defaultextension=extension,
+            filetypes=[(type_label, f"*{extension}"), ("All files", "*.*")],
+            initialfile=f"cv_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}{extension}"
+        ) or None
+    
+    def _start_export(self, writer, filename, format_name, success_text="Results exported successfully to"):
+        """Run writer(filename) on a background thread; the Tk thread polls for the outcome"""
+        self._set_busy(True)
         
-        if not filename:
-            return
+        # The worker makes no Tk calls: it only queues (handler, args) for the Tk thread
+        def worker():
+            try:
+                writer(filename)
+            except Exception as e:
+                self._export_results.put((self._on_export_failed, (format_name, str(e))))
+            else:
+                self._export_results.put((self._on_export_done, (f"{success_text}:\n{filename}",)))
         
+        threading.Thread(target=worker, daemon=True).start()
+        self.after(EXPORT_POLL_MS, self._poll_export)
+    
+    def _poll_export(self):
+        """Report the export outcome once the worker has queued it"""
+        if not self.winfo_exists():
+            return
         try:
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(["Rank", "CV File", "Fit Score", "Recommendation", "Skills", "Experience"])
-                
-                for i, candidate in enumerate(self.candidates, 1):
-                    skills = ", ".join(candidate.get("skills", []))
-                    experience = ", ".join(candidate.get("experience", []))
-                    writer.writerow([
-                        i,
-                        os.path.basename(candidate.get("cv_file", "")),
-                        candidate.get("fit_score", ""),
-                        candidate.get("recommendation", ""),
-                        skills,
-                        experience
-                    ])
-            
-            messagebox.showinfo("Success", f"Results exported successfully to:\n{filename}")
-            self.destroy()
-        except Exception as e:
-            messagebox.showerror("Export Failed", f"Failed to export CSV:\n{str(e)}")
+            handler, args = self._export_results.get_nowait()
+        except queue.Empty:
+            self.after(EXPORT_POLL_MS, self._poll_export)
+            return
+        handler(*args)
+    
+    def _on_export_done(self, message):
+        """Show the success message and close the dialog"""
+        self._set_busy(False)
+        messagebox.showinfo("Success", message)
+        self.destroy()
+    
+    def _on_export_failed(self, format_name, error_message):
+        """Show the error and let the user try again"""
+        self._set_busy(False)
+        messagebox.showerror("Export Failed", f"Failed to export {format_name}:\n{error_message}")
+    
+    def _export_csv(self):
+        """Export results to CSV"""
+        filename = self._ask_filename(".csv", "CSV files")
+        if filename:
+            self._start_export(self._write_csv, filename, "CSV")
     
     def _export_json(self):
         """Export results to JSON"""
-        if not self.candidates:
-            messagebox.showwarning("No Data", "No analysis data available to export.")
-            self.destroy()
-            return
-        
-        filename = filedialog.asksaveasfilename(
-            defaultextension=".json",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
-            initialfile=f"cv_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        )
-        
-        if not filename:
-            return
-        
-        try:
-            export_data = {
-                "analysis_date": datetime.now().isoformat(),
-                "total_candidates": len(self.candidates),
-                "statistics": self.stats,
-                "candidates": self.candidates
-            }
-            
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
-            
-            messagebox.showinfo("Success", f"Results exported successfully to:\n{filename}")
-            self.destroy()
-        except Exception as e:
-            messagebox.showerror("Export Failed", f"Failed to export JSON:\n{str(e)}")
+        filename = self._ask_filename(".json", "JSON files")
+        if filename:
+            self._start_export(self._write_json, filename, "JSON")
+    
+    def _export_jsonl(self):
+        """Export results to JSON Lines (one candidate per line)"""
+        filename = self._ask_filename(".jsonl", "JSON Lines files")
+        if filename:
+            self._start_export(self._write_jsonl, filename, "JSON Lines")
     
     def _export_excel(self):
         """Export results to Excel (XLSX)"""
-        if not self.candidates:
-            messagebox.showwarning("No Data", "No analysis data available to export.")
-            self.destroy()
+        filename = self._ask_filename(".xlsx", "Excel files")
+        if not filename:
             return
         
-        filename = filedialog.asksaveasfilename(
-            defaultextension=".xlsx",
-            filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")],
-            initialfile=f"cv_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-        )
-        
-        if not filename:
+        if not (importlib.util.find_spec("xlsxwriter") or importlib.util.find_spec("openpyxl")):
+            # Fall back to CSV if no Excel writer is available
+            messagebox.showwarning(
+                "Excel Export Not Available",
+                "Neither 'xlsxwriter' nor 'openpyxl' is installed.\n\n"
+                "Exporting as CSV instead.\n\n"
+                "To enable Excel export, install: pip install xlsxwriter"
+            )
+            # Change extension to .csv
+            filename = filename.replace('.xlsx', '.csv')
+            self._start_export(self._write_csv, filename, "CSV", "Results exported as CSV to")
             return
         
-        try:
-            # Try to use openpyxl for Excel export
-            try:
-                from openpyxl import Workbook
-                from openpyxl.styles import Font, PatternFill, Alignment
-                
-                wb = Workbook()
-                ws = wb.active
-                ws.title = "CV Analysis Results"
-                
-                # Header row with styling
-                headers = ["Rank", "CV File", "Fit Score", "Recommendation", "Skills", "Experience"]
-                ws.append(headers)
-                
-                # Style header
-                for cell in ws[1]:
-                    cell.font = Font(bold=True, color="FFFFFF")
-                    cell.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-                    cell.alignment = Alignment(horizontal="center")
-                
-                # Data rows
-                for i, candidate in enumerate(self.candidates, 1):
-                    skills = ", ".join(candidate.get("skills", []))
-                    experience = ", ".join(candidate.get("experience", []))
-                    ws.append([
-                        i,
-                        os.path.basename(candidate.get("cv_file", "")),
-                        candidate.get("fit_score", ""),
-                        candidate.get("recommendation", ""),
-                        skills,
-                        experience
-                    ])
-                
-                # Auto-adjust column widths
-                for column in ws.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)
-                    ws.column_dimensions[column_letter].width = adjusted_width
-                
-                wb.save(filename)
-                messagebox.showinfo("Success", f"Results exported successfully to:\n{filename}")
-                self.destroy()
-                
-            except ImportError:
-                # Fall back to CSV if openpyxl is not available
-                messagebox.showwarning(
-                    "Excel Export Not Available",
-                    "The 'openpyxl' library is not installed.\n\n"
-                    "Exporting as CSV instead.\n\n"
-                    "To enable Excel export, install: pip install openpyxl"
-                )
-                # Change extension to .csv
-                filename = filename.replace('.xlsx', '.csv')
-                self._save_as_csv(filename)
-                
-        except Exception as e:
-            messagebox.showerror("Export Failed", f"Failed to export Excel:\n{str(e)}")
+        self._start_export(self._write_excel, filename, "Excel")
     
     def _export_txt(self):
         """Export results to Plain Text"""
-        if not self.candidates:
-            messagebox.showwarning("No Data", "No analysis data available to export.")
-            self.destroy()
+        filename = self._ask_filename(".txt", "Text files")
+        if filename:
+            self._start_export(self._write_txt, filename, "text file")
+    
+    # File writers (run on the export thread, no Tk calls)
+    def _rows(self):
+        """Return the tabular export rows (joined list fields are cached per candidate)"""
+        return [
+            _candidate_row(i, candidate)
+            for i, candidate in enumerate(self.candidates, 1)
+        ]
+    
+    def _write_csv(self, filename):
+        """Write results to CSV"""
+        rows = self._rows()
+        
+        if len(rows) > CSV_IN_MEMORY_MAX_ROWS:
+            with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+                writer = csv.writer(f)
+                writer.writerow(EXPORT_HEADERS)
+                writer.writerows(rows)
             return
         
-        filename = filedialog.asksaveasfilename(
-            defaultextension=".txt",
-            filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
-            initialfile=f"cv_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+        # Serialize in memory, then hand the file a single write
+        buf = io.StringIO(newline='')
+        writer = csv.writer(buf)
+        writer.writerow(EXPORT_HEADERS)
+        writer.writerows(rows)
+        with open(filename, 'wb') as f:
+            f.write(buf.getvalue().encode('utf-8'))
+    
+    def _write_json(self, filename):
+        """Write results to JSON"""
+        envelope = {
+            "analysis_date": datetime.now().isoformat(),
+            "total_candidates": len(self.candidates),
+            "statistics": self.stats
+        }
+        
+        _write_json_stream(
+            filename,
+            envelope,
+            "candidates",
+            (strip_cached_fields(c) for c in self.candidates)
         )
+    
+    def _write_jsonl(self, filename):
+        """Write results to JSON Lines: a summary line, then one line per candidate"""
+        summary = {
+            "analysis_date": datetime.now().isoformat(),
+            "total_candidates": len(self.candidates),
+            "statistics": self.stats
+        }
         
-        if not filename:
+        with open(filename, 'wb', buffering=1 << 20) as f:
+            f.write(_dumps(summary) + b'\n')
+            for candidate in self.candidates:
+                f.write(_dumps(strip_cached_fields(candidate)) + b'\n')
+    
+    def _write_excel(self, filename):
+        """Write results to Excel (XLSX), streaming rows with xlsxwriter when available"""
+        try:
+            import xlsxwriter
+        except ImportError:
+            self._write_excel_openpyxl(filename)
             return
         
+        # constant_memory flushes each row to disk as soon as the next one starts
+        wb = xlsxwriter.Workbook(filename, {'constant_memory': True, 'strings_to_urls': False})
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write("=" * 80 + "\n")
-                f.write("CV ANALYSIS RESULTS\n")
-                f.write("=" * 80 + "\n\n")
-                f.write(f"Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Total Candidates: {len(self.candidates)}\n\n")
-                
-                # Statistics
-                f.write("STATISTICS:\n")
-                f.write("-" * 40 + "\n")
-                f.write(f"  Shortlisted: {self.stats.get('shortlist', 0)}\n")
-                f.write(f"  For Review: {self.stats.get('review', 0)}\n")
-                f.write(f"  Other: {self.stats.get('reject', 0)}\n\n")
-                
-                # Candidates
-                f.write("CANDIDATES:\n")
-                f.write("=" * 80 + "\n\n")
-                
-                for i, candidate in enumerate(self.candidates, 1):
-                    f.write(f"#{i} - {os.path.basename(candidate.get('cv_file', 'Unknown'))}\n")
-                    f.write("-" * 80 + "\n")
-                    f.write(f"Fit Score: {candidate.get('fit_score', 'N/A')}%\n")
-                    f.write(f"Recommendation: {candidate.get('recommendation', 'N/A')}\n")
-                    
-                    skills = candidate.get("skills", [])
-                    if skills:
-                        f.write(f"Skills: {', '.join(skills)}\n")
-                    
-                    experience = candidate.get("experience", [])
-                    if experience:
-                        f.write(f"Experience: {', '.join(experience)}\n")
-                    
-                    f.write("\n")
+            ws = wb.add_worksheet("CV Analysis Results")
+            header_fmt = wb.add_format({
+                'bold': True,
+                'font_color': '#FFFFFF',
+                'bg_color': '#4472C4',
+                'align': 'center'
+            })
             
-            messagebox.showinfo("Success", f"Results exported successfully to:\n{filename}")
-            self.destroy()
-        except Exception as e:
-            messagebox.showerror("Export Failed", f"Failed to export text file:\n{str(e)}")
+            headers = EXPORT_HEADERS
+            ws.write_row(0, 0, headers, header_fmt)
+            
+            # Data rows, tracking column widths in the same pass
+            max_len = [len(h) for h in headers]
+            for i, row in enumerate(self._rows(), 1):
+                for j, value in enumerate(row):
+                    length = len(str(value))
+                    if length > max_len[j]:
+                        max_len[j] = length
+                ws.write_row(i, 0, row)
+            
+            # Auto-adjust column widths
+            for j, width in enumerate(max_len):
+                ws.set_column(j, j, min(width + 2, 50))
+        finally:
+            wb.close()
     
-    def _save_as_csv(self, filename):
-        """Helper method to save as CSV (used by Excel fallback)"""
-        try:
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(["Rank", "CV File", "Fit Score", "Recommendation", "Skills", "Experience"])
-                
-                for i, candidate in enumerate(self.candidates, 1):
-                    skills = ", ".join(candidate.get("skills", []))
-                    experience = ", ".join(candidate.get("experience", []))
-                    writer.writerow([
-                        i,
-                        os.path.basename(candidate.get("cv_file", "")),
-                        candidate.get("fit_score", ""),
-                        candidate.get("recommendation", ""),
-                        skills,
-                        experience
-                    ])
+    def _write_excel_openpyxl(self, filename):
+        """Write results to Excel (XLSX) with openpyxl"""
+        from openpyxl import Workbook
+        from openpyxl.styles import Font, PatternFill, Alignment
+        from openpyxl.utils import get_column_letter
+        
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "CV Analysis Results"
+        
+        # Header row with styling
+        headers = EXPORT_HEADERS
+        ws.append(headers)
+        
+        # Style header
+        for cell in ws[1]:
+            cell.font = Font(bold=True, color="FFFFFF")
+            cell.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+            cell.alignment = Alignment(horizontal="center")
+        
+        # Data rows, tracking column widths in the same pass
+        max_len = [len(h) for h in headers]
+        for row in self._rows():
+            for j, value in enumerate(row):
+                length = len(str(value))
+                if length > max_len[j]:
+                    max_len[j] = length
+            ws.append(row)
+        
+        # Auto-adjust column widths
+        for j, width in enumerate(max_len, 1):
+            ws.column_dimensions[get_column_letter(j)].width = min(width + 2, 50)
+        
+        wb.save(filename)
+    
+    def _write_txt(self, filename):
+        """Write results to Plain Text"""
+        parts = [
+            "=" * 80 + "\n",
+            "CV ANALYSIS RESULTS\n",
+            "=" * 80 + "\n\n",
+            f"Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"Total Candidates: {len(self.candidates)}\n\n",
             
-            messagebox.showinfo("Success", f"Results exported as CSV to:\n{filename}")
-            self.destroy()
-        except Exception as e:
-            messagebox.showerror("Export Failed", f"Failed to export CSV:\n{str(e)}")
+            # Statistics
+            "STATISTICS:\n",
+            "-" * 40 + "\n",
+            f"  Shortlisted: {self.stats.get('shortlist', 0)}\n",
+            f"  For Review: {self.stats.get('review', 0)}\n",
+            f"  Other: {self.stats.get('reject', 0)}\n\n",
+            
+            # Candidates
+            "CANDIDATES:\n",
+            "=" * 80 + "\n\n",
+        ]
+        add = parts.append
+        rule = "-" * 80 + "\n"
+        
+        for i, candidate in enumerate(self.candidates, 1):
+            get = candidate.get
+            add(f"#{i} - {get_display_name(candidate) or 'Unknown'}\n")
+            add(rule)
+            add(f"Fit Score: {get('fit_score', 'N/A')}%\n")
+            add(f"Recommendation: {get('recommendation', 'N/A')}\n")
+            
+            skills = get_joined_list(candidate, "skills")
+            if skills:
+                add(f"Skills: {skills}\n")
+            
+            experience = get_joined_list(candidate, "experience")
+            if experience:
+                add(f"Experience: {experience}\n")
+            
+            add("\n")
+        
+        # One write once the whole report is built
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write("".join(parts))
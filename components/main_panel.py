@@ -3,8 +3,26 @@ Main Panel Component - Job description input and results display
 """
 
 import customtkinter as ctk
+from tkinter import TclError
 from .theme_manager import ThemeManager
-from .candidate_card import CandidateCard
+from .candidate_card import CandidateCard, build_card_columns
+
+
+# Cards are created a page at a time as the user scrolls towards the end
+CARD_PAGE_SIZE = 8
+
+# Cards created per event-loop turn while a page is being rendered
+CARD_RENDER_CHUNK = 4
+SCROLL_LOAD_THRESHOLD = 0.9
+
+# Most cards kept alive in the pool; hidden cards beyond this are destroyed, least recently used first
+CARD_POOL_MAX = 48
+
+# Delay before recounting the job description after the last keystroke
+CHAR_COUNT_DELAY_MS = 50
+
+# Delay before re-filtering results after the last search keystroke
+SEARCH_DELAY_MS = 120
 
 
 class MainPanel(ctk.CTkFrame):
@@ -21,6 +39,21 @@ class MainPanel(ctk.CTkFrame):
         
         self.results_widgets = []
         
+        # Cards kept alive between refreshes, keyed by CV file (least recently used first)
+        self._card_pool = {}
+        self._pooled_keys_shown = set()
+        
+        # Lazy rendering state
+        self._card_columns = None
+        self._rendered_count = 0
+        self._page_scheduled = False
+        self._page_end = 0
+        self._render_generation = 0
+        
+        # Pending debounced character count / search
+        self._count_job = None
+        self._search_job = None
+        
         # Grid configuration
         self.grid_rowconfigure(1, weight=1)
         self.grid_rowconfigure(3, weight=2)
@@ -90,7 +123,7 @@ class MainPanel(ctk.CTkFrame):
             corner_radius=8
         )
         self.search_entry.grid(row=0, column=1, sticky="e", padx=(0, 10))
-        self.search_entry.bind("<KeyRelease>", lambda e: self.on_search_callback())
+        self.search_entry.bind("<KeyRelease>", self._on_search_key)
         
         # Sort menu
         self.sort_menu = ctk.CTkOptionMenu(
@@ -146,13 +179,118 @@ class MainPanel(ctk.CTkFrame):
         )
         self.results_frame.grid(row=3, column=0, sticky="nsew")
         self.results_frame.grid_columnconfigure(0, weight=1)
+        
+        # Watch scroll position so more cards are created only when needed. These are
+        # CTkScrollableFrame internals: without them every page is rendered up front.
+        canvas = getattr(self.results_frame, "_parent_canvas", None)
+        self._results_scrollbar = getattr(self.results_frame, "_scrollbar", None)
+        self._lazy_pages = canvas is not None and self._results_scrollbar is not None
+        if self._lazy_pages:
+            canvas.configure(yscrollcommand=self._on_results_scrolled)
     
     def _update_char_count(self, event=None):
+        """Schedule a character count once typing pauses"""
+        if self._count_job is not None:
+            self.after_cancel(self._count_job)
+        self._count_job = self.after(CHAR_COUNT_DELAY_MS, self._do_char_count)
+    
+    def _do_char_count(self):
         """Update character count"""
-        content = self.jd_textbox.get("1.0", "end-1c")
-        char_count = len(content)
+        self._count_job = None
+        
+        # Let Tk count the characters instead of copying the text into Python
+        text_widget = getattr(self.jd_textbox, "_textbox", None)
+        if text_widget is not None:
+            counted = text_widget.count("1.0", "end-1c", "chars")
+            char_count = counted[0] if counted else 0
+        else:
+            char_count = len(self.jd_textbox.get("1.0", "end-1c"))
+        
         self.char_count_label.configure(text=f"{char_count} characters")
     
+    def _on_search_key(self, event=None):
+        """Schedule a search once typing pauses"""
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(SEARCH_DELAY_MS, self._run_search)
+    
+    def _run_search(self):
+        """Re-filter results for the current search query"""
+        self._search_job = None
+        self.on_search_callback()
+    
+    def _on_results_scrolled(self, first, last):
+        """Forward scroll position to the scrollbar and load the next page near the end"""
+        self._results_scrollbar.set(first, last)
+        if (not self._page_scheduled and self._card_columns is not None
+                and self._rendered_count < len(self._card_columns["data"])
+                and float(last) >= SCROLL_LOAD_THRESHOLD):
+            self._page_scheduled = True
+            self.after_idle(self._render_next_page, self._render_generation)
+    
+    def _render_next_page(self, generation):
+        """Start showing the next page of candidate cards"""
+        if generation != self._render_generation or self._card_columns is None:
+            return
+        
+        self._page_scheduled = True
+        self._page_end = min(self._rendered_count + CARD_PAGE_SIZE, len(self._card_columns["data"]))
+        self._render_chunk(generation)
+    
+    def _render_chunk(self, generation):
+        """Show a few cards of the current page, then yield to the event loop"""
+        # A newer display_results() call supersedes this render
+        if generation != self._render_generation:
+            return
+        
+        start = self._rendered_count
+        end = min(start + CARD_RENDER_CHUNK, self._page_end)
+        for i in range(start, end):
+            card = self._get_card(i)
+            # Skip the geometry request when a reused card is already in place
+            if card._row != i:
+                card.grid(row=i, column=0, padx=0, pady=6, sticky="ew")
+                card._row = i
+        self._rendered_count = end
+        
+        if end < self._page_end:
+            self.after(0, self._render_chunk, generation)
+        elif not self._lazy_pages and end < len(self._card_columns["data"]):
+            # No scroll position to watch: go on to the next page straight away
+            self.after(0, self._render_next_page, generation)
+        else:
+            self._page_scheduled = False
+    
+    def _get_card(self, index):
+        """Reuse the pooled card for this candidate if there is one, else create it"""
+        key = self._card_columns["data"][index].get("cv_file")
+        
+        if key in self._pooled_keys_shown:
+            # Duplicate CV file in this result set: give it its own card
+            card = CandidateCard(self.results_frame, index, self._card_columns, self.on_details_callback)
+            self.results_widgets.append(card)
+            return card
+        self._pooled_keys_shown.add(key)
+        
+        card = self._card_pool.pop(key, None)
+        if card is None:
+            card = CandidateCard(self.results_frame, index, self._card_columns, self.on_details_callback)
+        else:
+            card.update_candidate(index, self._card_columns)
+        self._card_pool[key] = card
+        return card
+    
+    def _trim_card_pool(self):
+        """Destroy hidden pooled cards, least recently used first, until the pool fits CARD_POOL_MAX"""
+        excess = len(self._card_pool) - CARD_POOL_MAX
+        if excess <= 0:
+            return
+        for key in [k for k, card in self._card_pool.items() if card._row is None][:excess]:
+            try:
+                self._card_pool.pop(key).destroy()
+            except TclError:
+                pass
+    
     # Public methods
     def get_job_description(self):
         """Get job description text"""
@@ -163,14 +301,17 @@ class MainPanel(ctk.CTkFrame):
         return self.search_entry.get().lower()
     
     def display_results(self, candidates):
-        """Display candidate results"""
-        # Clear previous results
-        for widget in self.results_widgets:
-            try:
-                widget.destroy()
-            except:
-                pass
-        self.results_widgets.clear()
+        """Display candidate results, reusing cards for candidates already shown"""
+        self._reset_results()
+        
+        # Unmap (but keep) cards that are filtered out or not on the first page;
+        # cards already on the first page stay mapped and move only if needed
+        first_page = {c.get("cv_file") for c in candidates[:CARD_PAGE_SIZE]}
+        for key, card in self._card_pool.items():
+            if card._row is not None and key not in first_page:
+                card.grid_remove()
+                card._row = None
+        self._trim_card_pool()
         
         if not candidates:
             no_results = ctk.CTkLabel(
@@ -183,22 +324,34 @@ class MainPanel(ctk.CTkFrame):
             self.results_widgets.append(no_results)
             return
         
-        # Create candidate cards
-        for i, candidate in enumerate(candidates):
-            card = CandidateCard(
-                self.results_frame,
-                i,
-                candidate,
-                self.on_details_callback
-            )
-            card.grid(row=i, column=0, padx=0, pady=6, sticky="ew")
-            self.results_widgets.append(card)
+        # Columns are computed once; cards are created lazily page by page
+        self._card_columns = build_card_columns(candidates)
+        self._render_next_page(self._render_generation)
+        
+        # Settle the whole re-layout in one geometry pass
+        self.results_frame.update_idletasks()
     
-    def clear_results(self):
-        """Clear all results"""
+    def _reset_results(self):
+        """Forget the current result set and destroy widgets that are not pooled"""
+        # Invalidate any page render still in flight
+        self._render_generation += 1
+        self._page_scheduled = False
+        self._card_columns = None
+        self._rendered_count = 0
+        self._pooled_keys_shown.clear()
         for widget in self.results_widgets:
             try:
                 widget.destroy()
-            except:
+            except TclError:
                 pass
         self.results_widgets.clear()
+    
+    def clear_results(self):
+        """Clear all results"""
+        self._reset_results()
+        for card in self._card_pool.values():
+            try:
+                card.destroy()
+            except TclError:
+                pass
+        self._card_pool.clear()
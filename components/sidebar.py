@@ -5,9 +5,28 @@ Sidebar Component - Left sidebar with controls and settings
 import customtkinter as ctk
 from tkinter import filedialog
 import os
+import queue
 from .theme_manager import ThemeManager
 
 
+# Interval at which queued progress is drawn while analysis runs (~20 Hz)
+PROGRESS_REFRESH_MS = 50
+
+# Run button options for its two states, applied in a single configure()
+RUN_BUTTON_IDLE = {
+    "state": "normal",
+    "text": "🚀 Start Analysis",
+    "fg_color": "transparent",
+    "text_color": ("#5568d3", "#ffffff"),
+}
+RUN_BUTTON_BUSY = {
+    "state": "disabled",
+    "text": "⏳ Analyzing...",
+    "fg_color": ThemeManager.COLORS["primary"],
+    "text_color": "#ffffff",
+}
+
+
 class Sidebar(ctk.CTkFrame):
     """Sidebar component with directory selection, analysis controls, and settings"""
     
@@ -22,24 +41,49 @@ class Sidebar(ctk.CTkFrame):
         self.parallel_workers = 3
         self.enable_summaries = False
         
+        # (current, total, elapsed) tuples posted by the worker, and the poll timer
+        self._progress_queue = queue.SimpleQueue()
+        self._progress_job = None
+        
+        # Last text/color applied per label, to skip no-op configure calls
+        self._label_texts = {}
+        self._label_colors = {}
+        self._analyzing = None
+        
         # Setup UI
         self.grid_propagate(False)
         self.grid_rowconfigure(7, weight=1)
         
+        # Widgets are gridded in one pass once they all exist
+        self._pending_grids = []
+        
         self._create_header()
         self._create_directory_section()
         self._create_run_button()
-        self._create_progress_section()
-        self._create_stats_section()
+        # Progress and stats sections are built the first time they are shown
+        self.progress_frame = None
+        self.stats_frame = None
         self._create_performance_section()
         self._create_appearance_selector()
         self._create_status_label()
+        
+        self._apply_pending_grids()
+    
+    def _queue_grid(self, widget, **grid_kwargs):
+        """Record a grid placement to apply once construction is done"""
+        self._pending_grids.append((widget, grid_kwargs))
+    
+    def _apply_pending_grids(self):
+        """Grid every queued widget in a single pass"""
+        for widget, grid_kwargs in self._pending_grids:
+            widget.grid(**grid_kwargs)
+        self._pending_grids = None
     
     def _create_header(self):
         """Create header with logo and subtitle"""
         # Logo frame
         logo_frame = ctk.CTkFrame(self, fg_color="transparent")
-        logo_frame.grid(row=0, column=0, padx=20, pady=(30, 5), sticky="ew")
+        self._queue_grid(logo_frame, row=0, column=0, padx=20, pady=(30, 5), sticky="ew")
         
         logo_label = ctk.CTkLabel(
             logo_frame,
@@ -56,11 +100,11 @@ class Sidebar(ctk.CTkFrame):
             font=ThemeManager.get_font("small"),
             text_color=("#6b7280", "#a0aec0")
         )
-        subtitle.grid(row=1, column=0, padx=20, pady=(0, 30))
+        self._queue_grid(subtitle, row=1, column=0, padx=20, pady=(0, 30))
         
         # Divider
         divider = ctk.CTkFrame(self, height=2, fg_color=("#e5e7eb", "#2d3748"))
-        divider.grid(row=2, column=0, sticky="ew", padx=20, pady=(0, 20))
+        self._queue_grid(divider, row=2, column=0, sticky="ew", padx=20, pady=(0, 20))
     
     def _create_directory_section(self):
         """Create CV directory selection section"""
@@ -71,7 +115,7 @@ class Sidebar(ctk.CTkFrame):
             font=ThemeManager.get_font("subheading"),
             anchor="w"
         )
-        label.grid(row=3, column=0, padx=20, pady=(0, 8), sticky="w")
+        self._queue_grid(label, row=3, column=0, padx=20, pady=(0, 8), sticky="w")
         
         # Entry
         self.dir_entry = ctk.CTkEntry(
@@ -82,7 +126,7 @@ class Sidebar(ctk.CTkFrame):
             border_width=2,
             border_color=("#d1d5db", "#2d3748")
         )
-        self.dir_entry.grid(row=4, column=0, padx=20, pady=(0, 10), sticky="ew")
+        self._queue_grid(self.dir_entry, row=4, column=0, padx=20, pady=(0, 10), sticky="ew")
         
         # Browse button
         self.browse_btn = ctk.CTkButton(
@@ -93,7 +137,7 @@ class Sidebar(ctk.CTkFrame):
             font=ThemeManager.get_font("body_bold"),
             **ThemeManager.get_button_style("primary")
         )
-        self.browse_btn.grid(row=5, column=0, padx=20, pady=(0, 25), sticky="ew")
+        self._queue_grid(self.browse_btn, row=5, column=0, padx=20, pady=(0, 25), sticky="ew")
     
     def _create_run_button(self):
         """Create main run analysis button"""
@@ -102,7 +146,7 @@ class Sidebar(ctk.CTkFrame):
             text="🚀 Start Analysis",
             command=self._on_run_clicked,
             height=55,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=ThemeManager.get_font("button_large"),
             corner_radius=12,
             fg_color="transparent",
             border_width=2,
@@ -110,13 +154,12 @@ class Sidebar(ctk.CTkFrame):
             text_color=("#5568d3", "#ffffff"),
             hover_color=("#e0e7ff", "#667eea")
         )
-        self.run_btn.grid(row=6, column=0, padx=20, pady=(0, 20), sticky="ew")
+        self._queue_grid(self.run_btn, row=6, column=0, padx=20, pady=(0, 20), sticky="ew")
     
     def _create_progress_section(self):
         """Create progress indicator section"""
         self.progress_frame = ctk.CTkFrame(self, fg_color="transparent")
         self.progress_frame.grid(row=7, column=0, padx=20, pady=(0, 10), sticky="new")
-        self.progress_frame.grid_remove()
         
         self.progress_label = ctk.CTkLabel(
             self.progress_frame,
@@ -159,7 +202,6 @@ class Sidebar(ctk.CTkFrame):
             fg_color=("#ffffff", "#0f1419")
         )
         self.stats_frame.grid(row=8, column=0, padx=20, pady=(10, 20), sticky="ew")
-        self.stats_frame.grid_remove()
         
         stats_title = ctk.CTkLabel(
             self.stats_frame,
@@ -180,7 +222,7 @@ class Sidebar(ctk.CTkFrame):
         """Create performance settings section"""
         # Divider
         divider = ctk.CTkFrame(self, height=2, fg_color=("#e5e7eb", "#2d3748"))
-        divider.grid(row=9, column=0, sticky="ew", padx=20, pady=(0, 15))
+        self._queue_grid(divider, row=9, column=0, sticky="ew", padx=20, pady=(0, 15))
         
         # Title
         title = ctk.CTkLabel(
@@ -189,11 +231,11 @@ class Sidebar(ctk.CTkFrame):
             anchor="w",
             font=ThemeManager.get_font("small_bold")
         )
-        title.grid(row=10, column=0, padx=20, pady=(0, 8), sticky="w")
+        self._queue_grid(title, row=10, column=0, padx=20, pady=(0, 8), sticky="w")
         
         # Workers slider
         workers_frame = ctk.CTkFrame(self, fg_color="transparent")
-        workers_frame.grid(row=11, column=0, padx=20, pady=(0, 10), sticky="ew")
+        self._queue_grid(workers_frame, row=11, column=0, padx=20, pady=(0, 10), sticky="ew")
         
         workers_label = ctk.CTkLabel(
             workers_frame,
@@ -223,12 +265,12 @@ class Sidebar(ctk.CTkFrame):
             button_hover_color=ThemeManager.COLORS["primary_dark"],
             progress_color=ThemeManager.COLORS["primary"]
         )
-        self.workers_slider.grid(row=12, column=0, padx=20, pady=(0, 10), sticky="ew")
+        self._queue_grid(self.workers_slider, row=12, column=0, padx=20, pady=(0, 10), sticky="ew")
         self.workers_slider.set(3)
         
         # Summary toggle
         summary_frame = ctk.CTkFrame(self, fg_color="transparent")
-        summary_frame.grid(row=13, column=0, padx=20, pady=(0, 10), sticky="ew")
+        self._queue_grid(summary_frame, row=13, column=0, padx=20, pady=(0, 10), sticky="ew")
         
         summary_label = ctk.CTkLabel(
             summary_frame,
@@ -259,7 +301,7 @@ class Sidebar(ctk.CTkFrame):
             anchor="w",
             font=ThemeManager.get_font("small_bold")
         )
-        label.grid(row=14, column=0, padx=20, pady=(10, 8), sticky="w")
+        self._queue_grid(label, row=14, column=0, padx=20, pady=(10, 8), sticky="w")
         
         self.appearance_menu = ctk.CTkOptionMenu(
             self,
@@ -271,7 +313,7 @@ class Sidebar(ctk.CTkFrame):
             button_color=ThemeManager.COLORS["primary_dark"],
             button_hover_color=ThemeManager.COLORS["primary_darker"]
         )
-        self.appearance_menu.grid(row=15, column=0, padx=20, pady=(0, 20), sticky="ew")
+        self._queue_grid(self.appearance_menu, row=15, column=0, padx=20, pady=(0, 20), sticky="ew")
         self.appearance_menu.set("Dark")
     
     def _create_status_label(self):
@@ -283,7 +325,7 @@ class Sidebar(ctk.CTkFrame):
             text_color=ThemeManager.COLORS["success"],
             anchor="w"
         )
-        self.status_label.grid(row=16, column=0, padx=20, pady=(10, 25), sticky="sw")
+        self._queue_grid(self.status_label, row=16, column=0, padx=20, pady=(10, 25), sticky="sw")
     
     # Event handlers
     def _on_browse_clicked(self):
@@ -303,12 +345,18 @@ class Sidebar(ctk.CTkFrame):
     def _on_workers_changed(self, value):
         """Handle workers slider change"""
         self.parallel_workers = int(value)
-        self.workers_value_label.configure(text=str(self.parallel_workers))
+        self._set_label(self.workers_value_label, str(self.parallel_workers))
     
     def _on_summary_toggled(self):
         """Handle summary switch toggle"""
         self.enable_summaries = bool(self.summary_switch.get())
     
+    def _set_label(self, label, text):
+        """Set a label's text unless it is already showing it"""
+        if self._label_texts.get(label) != text:
+            self._label_texts[label] = text
+            label.configure(text=text)
+    
     # Public methods
     def get_directory(self):
         """Get selected directory"""
@@ -323,21 +371,57 @@ class Sidebar(ctk.CTkFrame):
     
     def set_status(self, message, color=None):
         """Update status label"""
-        self.status_label.configure(text=message)
-        if color:
+        self._set_label(self.status_label, message)
+        if color and self._label_colors.get(self.status_label) != color:
+            self._label_colors[self.status_label] = color
             self.status_label.configure(text_color=color)
     
     def show_progress(self, show=True):
         """Show or hide progress indicator"""
+        # Stop polling and drop any progress still queued from a previous run
+        if self._progress_job is not None:
+            self.after_cancel(self._progress_job)
+            self._progress_job = None
+        self._take_latest_progress()
+        
         if show:
-            self.progress_frame.grid()
+            if self.progress_frame is None:
+                self._create_progress_section()
+            else:
+                self.progress_frame.grid()
             self.progress_bar.set(0)
-            self.progress_percent.configure(text="0%")
-            self.time_estimate_label.configure(text="Estimating time...")
-        else:
+            self._set_label(self.progress_percent, "0%")
+            self._set_label(self.time_estimate_label, "Estimating time...")
+            self._progress_job = self.after(PROGRESS_REFRESH_MS, self._poll_progress)
+        elif self.progress_frame is not None:
             self.progress_frame.grid_remove()
     
     def update_progress(self, current, total, elapsed_time=0):
+        """
+        Report analysis progress (safe to call from the worker thread)
+        
+        Updates are queued and only the latest one is drawn, every
+        PROGRESS_REFRESH_MS while the progress section is shown.
+        """
+        self._progress_queue.put((current, total, elapsed_time))
+    
+    def _take_latest_progress(self):
+        """Empty the progress queue and return its newest entry (or None)"""
+        latest = None
+        try:
+            while True:
+                latest = self._progress_queue.get_nowait()
+        except queue.Empty:
+            return latest
+    
+    def _poll_progress(self):
+        """Draw the newest queued progress, then poll again"""
+        latest = self._take_latest_progress()
+        if latest is not None:
+            self._draw_progress(*latest)
+        self._progress_job = self.after(PROGRESS_REFRESH_MS, self._poll_progress)
+    
+    def _draw_progress(self, current, total, elapsed_time):
         """Update progress bar with percentage and time estimate"""
         if total == 0:
             return
@@ -347,60 +431,54 @@ class Sidebar(ctk.CTkFrame):
         
         # Update progress bar and percentage
         self.progress_bar.set(progress)
-        self.progress_percent.configure(text=f"{percent}%")
+        self._set_label(self.progress_percent, f"{percent}%")
         
         # Calculate time estimate
         if current > 0 and elapsed_time > 0:
             avg_time_per_item = elapsed_time / current
             remaining_items = total - current
-            estimated_remaining = avg_time_per_item * remaining_items
+            estimated_remaining = int(avg_time_per_item * remaining_items)
             
             # Format time estimate
             if estimated_remaining < 60:
-                time_str = f"~{int(estimated_remaining)}s remaining"
-            elif estimated_remaining < 3600:
-                minutes = int(estimated_remaining / 60)
-                seconds = int(estimated_remaining % 60)
-                time_str = f"~{minutes}m {seconds}s remaining"
+                time_str = f"~{estimated_remaining}s remaining"
             else:
-                hours = int(estimated_remaining / 3600)
-                minutes = int((estimated_remaining % 3600) / 60)
-                time_str = f"~{hours}h {minutes}m remaining"
+                minutes, seconds = divmod(estimated_remaining, 60)
+                if minutes < 60:
+                    time_str = f"~{minutes}m {seconds}s remaining"
+                else:
+                    hours, minutes = divmod(minutes, 60)
+                    time_str = f"~{hours}h {minutes}m remaining"
             
-            self.time_estimate_label.configure(text=time_str)
-            self.progress_label.configure(text=f"Processing {current}/{total} CVs...")
+            self._set_label(self.time_estimate_label, time_str)
+            self._set_label(self.progress_label, f"Processing {current}/{total} CVs...")
         else:
-            self.time_estimate_label.configure(text="Calculating...")
-            self.progress_label.configure(text=f"Processing {current}/{total} CVs...")
+            self._set_label(self.time_estimate_label, "Calculating...")
+            self._set_label(self.progress_label, f"Processing {current}/{total} CVs...")
     
     def set_run_button_state(self, analyzing=False):
         """Update run button state"""
-        if analyzing:
-            self.run_btn.configure(
-                state="disabled",
-                text="⏳ Analyzing...",
-                fg_color=ThemeManager.COLORS["primary"],
-                text_color="#ffffff"
-            )
-        else:
-            self.run_btn.configure(
-                state="normal",
-                text="🚀 Start Analysis",
-                fg_color="transparent",
-                text_color=("#5568d3", "#ffffff")
-            )
+        if analyzing == self._analyzing:
+            return
+        self._analyzing = analyzing
+        
+        self.run_btn.configure(**(RUN_BUTTON_BUSY if analyzing else RUN_BUTTON_IDLE))
     
     def show_stats(self, stats):
         """Display analysis statistics"""
-        self.stats_frame.grid()
+        if self.stats_frame is None:
+            self._create_stats_section()
+        else:
+            self.stats_frame.grid()
         stats_text = (
             f"Total: {stats['total']}\n"
             f"✓ Shortlist: {stats['shortlist']}\n"
             f"● Review: {stats['review']}\n"
             f"✗ Other: {stats.get('reject', 0)}"
         )
-        self.stats_text.configure(text=stats_text)
+        self._set_label(self.stats_text, stats_text)
     
     def hide_stats(self):
         """Hide statistics section"""
-        self.stats_frame.grid_remove()
+        if self.stats_frame is not None:
+            self.stats_frame.grid_remove()
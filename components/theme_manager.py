@@ -2,6 +2,7 @@
 Theme Manager - Centralized styling and colors for the CV Scanner GUI
 """
 
+from types import MappingProxyType
 import customtkinter as ctk
 
 
@@ -26,6 +27,16 @@ class ThemeManager:
         "border_dark": "#2d3748",
     }
     
+    # Colors for the exact recommendations produced by the scorer
+    RECOMMENDATION_COLORS = {
+        "SHORTLIST": COLORS["success"],
+        "REVIEW": COLORS["info"],
+        "REJECT": COLORS["gray"],
+    }
+    
+    # CustomTkinter color theme applied by apply_theme()
+    COLOR_THEME = "blue"
+    
     # Gradient colors
     GRADIENTS = {
         "primary": ["#667eea", "#764ba2"],
@@ -44,8 +55,14 @@ class ThemeManager:
         "small": ("Segoe UI", 11),
         "small_bold": ("Segoe UI", 11, "bold"),
         "tiny": ("Segoe UI", 10),
+        # None keeps CustomTkinter's default family
+        "badge": (None, 22, "bold"),
+        "button_large": (None, 16, "bold"),
     }
     
+    # Shared CTkFont per font name, built by apply_theme() (or on first use before it)
+    _font_cache = {}
+    
     # Component styles
     BUTTON_STYLES = {
         "primary": {
@@ -67,6 +84,10 @@ class ThemeManager:
         },
     }
     
+    # Read-only views handed to callers, so the shared style dicts cannot be mutated
+    BUTTON_STYLES = {name: MappingProxyType(style) for name, style in BUTTON_STYLES.items()}
+    _EMPTY_STYLE = MappingProxyType({})
+    
     CARD_STYLES = {
         "default": {
             "corner_radius": 12,
@@ -85,19 +106,30 @@ class ThemeManager:
     
     @staticmethod
     def get_font(font_name):
-        """Get font configuration"""
-        font_config = ThemeManager.FONTS.get(font_name, ("Segoe UI", 13))
-        return ctk.CTkFont(family=font_config[0], size=font_config[1], 
-                          weight=font_config[2] if len(font_config) > 2 else "normal")
+        """Get font configuration (one shared CTkFont per font name)"""
+        font = ThemeManager._font_cache.get(font_name)
+        if font is None:
+            if font_name not in ThemeManager.FONTS:
+                # Unknown names share the body font
+                return ThemeManager.get_font("body")
+            family, size, *weight = ThemeManager.FONTS[font_name]
+            font = ctk.CTkFont(family=family, size=size, weight=weight[0] if weight else "normal")
+            ThemeManager._font_cache[font_name] = font
+        return font
     
     @staticmethod
     def get_button_style(style_name):
-        """Get button style configuration"""
-        return ThemeManager.BUTTON_STYLES.get(style_name, {})
+        """Get button style configuration (a shared read-only mapping)"""
+        return ThemeManager.BUTTON_STYLES.get(style_name, ThemeManager._EMPTY_STYLE)
     
     @staticmethod
     def get_recommendation_color(recommendation):
         """Get color based on recommendation type"""
+        color = ThemeManager.RECOMMENDATION_COLORS.get(recommendation)
+        if color is not None:
+            return color
+        
+        # Free-form text: fall back to substring matching
         rec_upper = recommendation.upper()
         if "SHORTLIST" in rec_upper:
             return ThemeManager.COLORS["success"]
@@ -110,4 +142,11 @@ class ThemeManager:
     def apply_theme(appearance_mode="dark"):
         """Apply global theme settings"""
         ctk.set_appearance_mode(appearance_mode)
-        ctk.set_default_color_theme("blue")
+        
+        # Loading a color theme parses its JSON file; CTk already loads "blue" on import
+        if getattr(ctk.ThemeManager, "_currently_loaded_theme", None) != ThemeManager.COLOR_THEME:
+            ctk.set_default_color_theme(ThemeManager.COLOR_THEME)
+        
+        # Build every font once now that a Tk root exists
+        for font_name in ThemeManager.FONTS:
+            ThemeManager.get_font(font_name)
@@ -1,21 +1,53 @@
+"""
+Fake CV Generator
+Generates sample CVs with a local LLM (LM Studio API) and renders them to PDF
+
+Performance characteristics (I/O and pure-Python string work, not numeric
+loops, so JIT compilers like Numba don't apply):
+- generate_cv_content / generate_cv_json: LLM network round trips; the
+  levers are the keep-alive session, concurrent workers and --batch
+- create_pdf / create_sidebar_pdf: python-markdown regex passes and the PDF
+  backend (xhtml2pdf, or the much faster WeasyPrint via --backend)
+- request_completions: JSON decoding of streamed frames (orjson if installed)
+"""
+
 import requests
+import functools
 import json
 import os
 import random
 import time
-import markdown
-from xhtml2pdf import pisa
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Optional fast JSON (C implementation) for request bodies and streamed frames
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configuration
 API_URL = "http://localhost:1234/v1/chat/completions"
 MODEL_NAME = "gemma-3-4b-it"
 OUTPUT_DIR = "generated_cvs"
+PDF_BACKEND = "auto"  # "auto", "weasyprint" or "pisa"
+
+# One keep-alive HTTP session for every LLM request
+SESSION = requests.Session()
+SESSION.headers.update({"Content-Type": "application/json"})
+# Connection failures are retried with backoff; POSTs are never re-sent after the server has them
+ADAPTER = HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=Retry(total=2, backoff_factor=0.3))
+SESSION.mount("http://", ADAPTER)
+SESSION.mount("https://", ADAPTER)
+
+# Fail fast if the LLM server is unreachable, but let long generations finish
+REQUEST_TIMEOUT = (10, None)
 
 # Ensure output directory exists
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 # CV Styles/Formats
-STYLES = [
+STYLES = (
     "Chronological",
     "Functional",
     "Modern",
@@ -24,10 +56,13 @@ STYLES = [
     "Executive",
     "Entry-Level",
     "Two-Column"
-]
+)
+
+# Styles picked from at random (Sidebar is rendered from JSON instead of Markdown)
+RANDOM_STYLES = STYLES + ("Sidebar",)
 
 # Target Roles for variety
-ROLES = [
+ROLES = (
     "Software Engineer",
     "Data Scientist",
     "Product Manager",
@@ -36,7 +71,7 @@ ROLES = [
     "Sales Representative",
     "Project Manager",
     "DevOps Engineer"
-]
+)
 
 # CSS Styles for PDF generation
 CSS_STYLES = {
@@ -103,8 +138,9 @@ CSS_STYLES = {
     """
 }
 
+@functools.lru_cache(maxsize=32)
 def get_css(style_name):
-    """Returns the CSS string for a given style name."""
+    """Returns the CSS string for a given style name (resolved once per name)."""
     if "Sidebar" in style_name:
         return CSS_STYLES["Sidebar"]
     elif "Modern" in style_name or "Two-Column" in style_name:
@@ -118,8 +154,58 @@ def get_css(style_name):
     else:
         return CSS_STYLES["Default"]
 
-def generate_cv_content(role, style):
-    """Generates CV content in Markdown using the local LLM."""
+def dumps_json(obj):
+    """Serializes obj to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+def loads_json(data):
+    """Parses JSON from str or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def request_completions(payload):
+    """Posts a streaming chat completion request and returns the text of each choice.
+
+    Returns one string per choice the server produced, which may be fewer
+    than payload["n"] on servers that ignore it.
+    """
+    parts = {}
+    with SESSION.post(API_URL, data=dumps_json(payload), timeout=REQUEST_TIMEOUT, stream=True) as response:
+        response.raise_for_status()
+        # Server-sent events: one "data: {...}" frame per token chunk, tagged with its choice index
+        for line in response.iter_lines():
+            if not line.startswith(b"data:"):
+                continue
+            data = line[5:].strip()
+            if data == b"[DONE]":
+                break
+            for choice in loads_json(data)['choices']:
+                content = choice.get('delta', {}).get('content')
+                if content:
+                    parts.setdefault(choice.get('index', 0), []).append(content)
+    return ["".join(parts[index]) for index in sorted(parts)]
+
+def build_payload(system_prompt, user_prompt, n=1):
+    """Builds a streaming chat completion payload asking for n completions."""
+    payload = {
+        "model": MODEL_NAME,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ],
+        "temperature": 0.7,
+        "max_tokens": -1,
+        "stream": True
+    }
+    if n > 1:
+        payload["n"] = n
+    return payload
+
+def generate_cv_content(role, style, n=1):
+    """Generates up to n CVs in Markdown using the local LLM; returns a list (empty on error)."""
     
     system_prompt = (
         "You are an expert resume writer. "
@@ -134,39 +220,30 @@ def generate_cv_content(role, style):
         "Output ONLY the markdown content."
     )
 
-    payload = {
-        "model": MODEL_NAME,
-        "messages": [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt}
-        ],
-        "temperature": 0.7,
-        "max_tokens": -1,
-        "stream": False
-    }
-
-    headers = {
-        "Content-Type": "application/json"
-    }
-
     try:
-        print(f"Generating {style} CV for {role}...")
-        response = requests.post(API_URL, headers=headers, data=json.dumps(payload))
-        response.raise_for_status()
-        result = response.json()
-        content = result['choices'][0]['message']['content']
-        return extract_markdown(content)
+        print(f"Generating {style} CV for {role}..." if n == 1 else f"Generating {n} {style} CVs for {role}...")
+        completions = request_completions(build_payload(system_prompt, user_prompt, n))
+        return [extract_markdown(content) for content in completions]
     except requests.exceptions.RequestException as e:
         print(f"Error calling API: {e}")
         if hasattr(e.response, 'text'):
             print(f"Response: {e.response.text}")
-        return None
-    except (KeyError, IndexError) as e:
+        return []
+    except (KeyError, IndexError, ValueError) as e:
         print(f"Error parsing response: {e}")
-        return None
+        return []
 
-def generate_cv_json(role):
-    """Generates structured CV data in JSON format."""
+def parse_cv_json(content):
+    """Parses a JSON CV, stripping any markdown fence around it."""
+    fenced = extract_fenced(content, "json")
+    if fenced is None:
+        fenced = extract_fenced(content, "")
+    if fenced is not None:
+        content = fenced
+    return loads_json(content)
+
+def generate_cv_json(role, n=1):
+    """Generates up to n structured CVs in JSON format; returns a list (empty on error)."""
     system_prompt = (
         "You are an expert resume writer. "
         "Generate a realistic, high-quality CV/resume in JSON format. "
@@ -179,59 +256,47 @@ def generate_cv_json(role):
     
     user_prompt = f"Generate a JSON resume for a {role}."
 
-    payload = {
-        "model": MODEL_NAME,
-        "messages": [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt}
-        ],
-        "temperature": 0.7,
-        "max_tokens": -1,
-        "stream": False
-    }
-    
-    headers = {"Content-Type": "application/json"}
-
     try:
-        print(f"Generating JSON CV for {role}...")
-        response = requests.post(API_URL, headers=headers, data=json.dumps(payload))
-        response.raise_for_status()
-        result = response.json()
-        content = result['choices'][0]['message']['content']
-        
-        # Clean up potential markdown wrapping around JSON
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1]
-            
-        return json.loads(content)
+        print(f"Generating JSON CV for {role}..." if n == 1 else f"Generating {n} JSON CVs for {role}...")
+        completions = request_completions(build_payload(system_prompt, user_prompt, n))
     except requests.exceptions.RequestException as e:
         print(f"Error calling API: {e}")
         if hasattr(e.response, 'text'):
             print(f"Response: {e.response.text}")
-        return None
+        return []
     except Exception as e:
         print(f"Error generating JSON: {e}")
+        return []
+
+    # A malformed completion only drops that CV, not the rest of the batch
+    results = []
+    for content in completions:
+        try:
+            results.append(parse_cv_json(content))
+        except Exception as e:
+            print(f"Error generating JSON: {e}")
+    return results
+
+def extract_fenced(text, tag):
+    """Returns the body of the first ```<tag> fence (an unterminated fence runs to the end), or None."""
+    opener = "```" + tag
+    start = text.find(opener)
+    if start < 0:
         return None
+    start += len(opener)
+    end = text.find("```", start)
+    return text[start:end] if end >= 0 else text[start:]
 
 def extract_markdown(text):
     """Extracts content within markdown code blocks if present."""
-    if "```markdown" in text:
-        parts = text.split("```markdown")
-        if len(parts) > 1:
-            content = parts[1].split("```")[0]
-            return content.strip()
-    elif "```" in text:
-        parts = text.split("```")
-        if len(parts) > 1:
-            content = parts[1]
-            return content.strip()
-    return text
+    content = extract_fenced(text, "markdown")
+    if content is None:
+        content = extract_fenced(text, "")
+    return content.strip() if content is not None else text
 
 def create_pdf(markdown_content, output_filename, style):
     """Converts Markdown to PDF with the specified style."""
-    html_body = markdown.markdown(markdown_content)
+    html_body = get_markdown().reset().convert(markdown_content)
     css = get_css(style)
     full_html = f"<html><head><style>{css}</style></head><body>{html_body}</body></html>"
     generate_pdf_from_html(full_html, output_filename)
@@ -246,16 +311,18 @@ def create_sidebar_pdf(json_data, output_filename):
     # Build HTML sections
     contact_html = "<br>".join(json_data.get('contact_info', []))
     
-    edu_html = ""
-    for edu in json_data.get('education', []):
-        edu_html += f"<p><strong>{edu.get('year')}</strong><br>{edu.get('degree')}<br>{edu.get('school')}</p>"
+    edu_html = "".join(
+        f"<p><strong>{edu.get('year')}</strong><br>{edu.get('degree')}<br>{edu.get('school')}</p>"
+        for edu in json_data.get('education', [])
+    )
         
-    skills_html = "<ul>" + "".join([f"<li>{s}</li>" for s in json_data.get('skills', [])]) + "</ul>"
+    skills_html = f"<ul>{''.join(f'<li>{s}</li>' for s in json_data.get('skills', []))}</ul>"
     
-    exp_html = ""
-    for job in json_data.get('experience', []):
-        details = "<ul>" + "".join([f"<li>{d}</li>" for d in job.get('details', [])]) + "</ul>"
-        exp_html += f"<h3>{job.get('role')}</h3><p><strong>{job.get('company')}</strong> | {job.get('duration')}</p>{details}"
+    exp_html = "".join(
+        f"<h3>{job.get('role')}</h3><p><strong>{job.get('company')}</strong> | {job.get('duration')}</p>"
+        f"<ul>{''.join(f'<li>{d}</li>' for d in job.get('details', []))}</ul>"
+        for job in json_data.get('experience', [])
+    )
 
     full_html = f"""
     <html>
@@ -287,22 +354,111 @@ def create_sidebar_pdf(json_data, output_filename):
     """
     generate_pdf_from_html(full_html, output_filename)
 
+# Markdown and the PDF backends are imported on first use so that --help and
+# startup don't pay for them
+
+@functools.lru_cache(maxsize=1)
+def get_markdown():
+    """Returns the shared Markdown converter, built once (processors and patterns are set up on creation).
+
+    Only used from the main thread, where PDFs are rendered.
+    """
+    import markdown
+    return markdown.Markdown()
+
+@functools.lru_cache(maxsize=1)
+def load_weasyprint():
+    """Returns WeasyPrint's HTML class (Cairo/Pango, much faster), or None if not installed."""
+    try:
+        from weasyprint import HTML
+    except ImportError:
+        return None
+    return HTML
+
+@functools.lru_cache(maxsize=1)
+def load_pisa():
+    """Returns the xhtml2pdf pisa module, or None if not installed."""
+    try:
+        from xhtml2pdf import pisa
+    except ImportError:
+        return None
+    return pisa
+
+def get_pdf_backend():
+    """Resolves PDF_BACKEND, preferring WeasyPrint for "auto"."""
+    if PDF_BACKEND == "auto":
+        return "weasyprint" if load_weasyprint() is not None else "pisa"
+    return PDF_BACKEND
+
 def generate_pdf_from_html(html_content, output_filename):
     """Helper to generate PDF from HTML string."""
+    backend = get_pdf_backend()
     try:
-        with open(output_filename, "wb") as result_file:
-            pisa_status = pisa.CreatePDF(html_content, dest=result_file)
-        if pisa_status.err:
-            print(f"Error generating PDF: {pisa_status.err}")
+        if backend == "weasyprint":
+            weasy_html = load_weasyprint()
+            if weasy_html is None:
+                raise ImportError("WeasyPrint is not installed (pip install weasyprint)")
+            weasy_html(string=html_content).write_pdf(output_filename)
         else:
-            print(f"Saved PDF to: {output_filename}")
+            pisa = load_pisa()
+            if pisa is None:
+                raise ImportError("xhtml2pdf is not installed (pip install xhtml2pdf)")
+            with open(output_filename, "wb") as result_file:
+                pisa_status = pisa.CreatePDF(html_content, dest=result_file)
+            if pisa_status.err:
+                print(f"Error generating PDF: {pisa_status.err}")
+                return
+        print(f"Saved PDF to: {output_filename}")
     except Exception as e:
         print(f"Exception during PDF generation: {e}")
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # ... (existing imports and constants) ...
 
+def fetch_cvs(role, style, count=1):
+    """Fetches up to count CVs from the LLM: JSON for Sidebar, Markdown otherwise.
+
+    Asks for all of them in one request ("n"); if the server returns fewer
+    choices, the rest are fetched one request at a time.
+    """
+    def generate(n):
+        if style == "Sidebar":
+            return generate_cv_json(role, n)
+        return generate_cv_content(role, style, n)
+
+    results = generate(count)
+    if count > 1:
+        for _ in range(count - len(results)):
+            results.extend(generate(1))
+    return results
+
+# Filename-safe form of roles and styles: lower-cased, spaces to underscores
+SAFE_NAME_TABLE = str.maketrans(" ", "_")
+
+@functools.lru_cache(maxsize=None)
+def safe_name(text):
+    """Returns text in the form used for output filenames, computed once per distinct value."""
+    return text.lower().translate(SAFE_NAME_TABLE)
+
+def save_cv(content, role, style, number):
+    """Renders fetched CV content to a PDF in OUTPUT_DIR."""
+    if not content:
+        return
+    
+    safe_role = safe_name(role)
+    timestamp = int(time.time())
+    
+    # Generation number keeps names unique when several finish in the same second
+    if style == "Sidebar":
+        filename = f"{safe_role}_sidebar_{timestamp}_{number}.pdf"
+        create_sidebar_pdf(content, os.path.join(OUTPUT_DIR, filename))
+    else:
+        safe_style = safe_name(style)
+        filename = f"{safe_role}_{safe_style}_{timestamp}_{number}.pdf"
+        create_pdf(content, os.path.join(OUTPUT_DIR, filename), style)
+
 def parse_arguments():
     """Parses command-line arguments."""
     parser = argparse.ArgumentParser(description="Generate fake CVs using a local LLM.")
@@ -310,22 +466,33 @@ def parse_arguments():
     parser.add_argument("--role", type=str, help="Specific role to generate (e.g., 'Software Engineer')")
     parser.add_argument("--style", type=str, help="Specific style to generate (e.g., 'Modern', 'Classic', 'Sidebar')")
     parser.add_argument("--output", type=str, default="generated_cvs", help="Output directory (default: 'generated_cvs')")
+    parser.add_argument("--backend", choices=("auto", "weasyprint", "pisa"), default="auto",
+                        help="PDF renderer: WeasyPrint if installed, else xhtml2pdf (default: auto)")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent LLM requests (default: 4)")
+    parser.add_argument("--batch", type=int, default=1,
+                        help="CVs with the same role and style to request per call via 'n' (default: 1)")
     return parser.parse_args()
 
 def main():
     args = parse_arguments()
     
     # Update Output Directory if needed
-    global OUTPUT_DIR
+    global OUTPUT_DIR, PDF_BACKEND
     OUTPUT_DIR = args.output
+    PDF_BACKEND = args.backend
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
     print("Starting Fake CV Generator (PDF Mode)...")
     print(f"Target URL: {API_URL}")
     print(f"Model: {MODEL_NAME}")
     print(f"Output Directory: {OUTPUT_DIR}")
+    print(f"Workers: {args.workers}")
+    print(f"Batch Size: {args.batch}")
+    print(f"PDF Backend: {get_pdf_backend()}")
     print("-" * 30)
 
+    # Pick every role/style up front so the workers only wait on the LLM
+    jobs = {}
     for i in range(args.count):
         # Determine Role
         if args.role:
@@ -337,30 +504,28 @@ def main():
         if args.style:
             style = args.style
         else:
-            # Add Sidebar to random choice
-            all_styles = STYLES + ["Sidebar"]
-            style = random.choice(all_styles)
+            style = random.choice(RANDOM_STYLES)
         
-        # Generate Content based on Style
-        if style == "Sidebar":
-            json_data = generate_cv_json(role)
-            if json_data:
-                safe_role = role.lower().replace(" ", "_")
-                timestamp = int(time.time())
-                filename = f"{safe_role}_sidebar_{timestamp}.pdf"
-                filepath = os.path.join(OUTPUT_DIR, filename)
-                create_sidebar_pdf(json_data, filepath)
-        else:
-            md_content = generate_cv_content(role, style)
-            if md_content:
-                safe_role = role.lower().replace(" ", "_")
-                safe_style = style.lower().replace(" ", "_")
-                timestamp = int(time.time())
-                filename = f"{safe_role}_{safe_style}_{timestamp}.pdf"
-                filepath = os.path.join(OUTPUT_DIR, filename)
-                create_pdf(md_content, filepath, style)
-        
-        print("-" * 30)
+        jobs.setdefault((role, style), []).append(i + 1)
+    
+    # CVs sharing a role and style are requested together, up to --batch per call
+    batch_size = max(1, args.batch)
+    batches = [(role, style, numbers[start:start + batch_size])
+               for (role, style), numbers in jobs.items()
+               for start in range(0, len(numbers), batch_size)]
+    
+    # LLM calls run concurrently; PDFs are rendered here as results arrive
+    workers = max(1, min(args.workers, len(batches)))
+    done = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(fetch_cvs, role, style, len(numbers)): (role, style, numbers)
+                   for role, style, numbers in batches}
+        for future in as_completed(futures):
+            role, style, numbers = futures[future]
+            for number, content in zip(numbers, future.result()):
+                save_cv(content, role, style, number)
+            done += len(numbers)
+            print(f"[{done}/{args.count}] " + "-" * 24)
 
     print("Generation complete.")
 
@@ -7,13 +7,19 @@ Architecture:
 - Centralized theme management
 - Clear separation of concerns
 - Event-driven architecture
+
+Performance: work on the Tk thread is widget churn and Python list/string
+handling (e.g. _apply_filters over cached keys and category buckets);
+analysis runs on a background thread.
 """
 
 import customtkinter as ctk
 from tkinter import messagebox
 import threading
+import queue
 import os
-from main import CVAnalyzer
+from bisect import bisect_right
+from operator import itemgetter
 
 from components import (
     ThemeManager,
@@ -22,6 +28,24 @@ from components import (
     DetailsModal,
     ExportDialog
 )
+from components.candidate_fields import (
+    get_search_name, get_score, get_score_text, get_category, get_skill_partition, get_detail_texts
+)
+
+# File extensions counted as CVs when a directory is browsed
+CV_EXTENSIONS = ('.pdf', '.docx', '.doc')
+
+# Candidates shown after an analysis (and while it streams in)
+TOP_CANDIDATES = 20
+
+# How long the completion summary stays in the status line
+COMPLETE_STATUS_MS = 3500
+
+# How often results scored so far are pushed to the results panel during analysis
+LIVE_RESULTS_MS = 250
+
+# How often the Tk thread handles events queued by the loader and analysis threads
+WORKER_EVENTS_MS = 100
 
 
 class CVScannerModular(ctk.CTk):
@@ -46,13 +70,30 @@ class CVScannerModular(ctk.CTk):
         self.analyzer_lock = threading.Lock()
         self.all_candidates = []
         self.filtered_candidates = []
+        self.candidates_by_category = {}
+        self._cv_count_cache = {}  # directory -> (mtime, CV file count)
+        self._details_modal = None
+        
+        # One long-lived analysis thread, fed (cv_dir, job_description) jobs
+        self._analysis_jobs = queue.SimpleQueue()
+        self._analysis_worker = None
+        
+        # Results streamed from the analysis thread, shown as they are scored
+        self._live_results = queue.SimpleQueue()
+        self._live_candidates = []
+        self._live_keys = []  # negated scores, ascending, parallel to _live_candidates
+        self._live_job = None
         self.analysis_stats = {"total": 0, "shortlist": 0, "review": 0, "reject": 0}
         
+        # (handler, args) queued by background threads, which make no Tk calls themselves
+        self._worker_events = queue.SimpleQueue()
+        
         # Create components
         self._create_components()
         
         # Initialize analyzer in background
         self.after(100, self._initialize_analyzer)
+        self.after(WORKER_EVENTS_MS, self._poll_worker_events)
     
     def _create_components(self):
         """Create and configure all UI components"""
@@ -77,15 +118,42 @@ class CVScannerModular(ctk.CTk):
         self.main_panel.grid(row=0, column=1, sticky="nsew", padx=25, pady=25)
     
     def _initialize_analyzer(self):
-        """Initialize the AI analyzer (runs once at startup)"""
+        """Start loading the AI analyzer on a background thread (runs once at startup)"""
+        self.sidebar.set_status("🔄 Loading AI model...", ThemeManager.COLORS["warning"])
+        threading.Thread(target=self._load_analyzer, daemon=True).start()
+    
+    def _load_analyzer(self):
+        """Construct the analyzer (in background thread) and queue the outcome for the Tk thread"""
         try:
-            self.sidebar.set_status("🔄 Loading AI model...", ThemeManager.COLORS["warning"])
-            self.analyzer = CVAnalyzer()
-            self.sidebar.set_status("✓ Ready to analyze", ThemeManager.COLORS["success"])
-            self._show_toast("AI model loaded and ready!", "success")
+            # Imported here so the analyzer stack loads off the Tk thread, after the window is up
+            from main import CVAnalyzer
+            analyzer = CVAnalyzer()
         except Exception as e:
-            self.sidebar.set_status(f"❌ Model load failed: {str(e)}", ThemeManager.COLORS["danger"])
-            messagebox.showerror("Initialization Error", f"Failed to load AI model:\n\n{str(e)}")
+            self._worker_events.put((self._on_analyzer_failed, (str(e),)))
+        else:
+            self._worker_events.put((self._on_analyzer_ready, (analyzer,)))
+    
+    def _poll_worker_events(self):
+        """Run the handlers background threads have queued, on the Tk thread"""
+        while True:
+            try:
+                handler, args = self._worker_events.get_nowait()
+            except queue.Empty:
+                break
+            handler(*args)
+        self.after(WORKER_EVENTS_MS, self._poll_worker_events)
+    
+    def _on_analyzer_ready(self, analyzer):
+        """Handle successful model load"""
+        with self.analyzer_lock:
+            self.analyzer = analyzer
+        self.sidebar.set_status("✓ Ready to analyze", ThemeManager.COLORS["success"])
+        self._show_toast("AI model loaded and ready!", "success")
+    
+    def _on_analyzer_failed(self, error_message):
+        """Handle model load failure"""
+        self.sidebar.set_status(f"❌ Model load failed: {error_message}", ThemeManager.COLORS["danger"])
+        messagebox.showerror("Initialization Error", f"Failed to load AI model:\n\n{error_message}")
     
     # Event handlers
     def _on_directory_selected(self, directory):
@@ -94,11 +162,24 @@ class CVScannerModular(ctk.CTk):
         
         # Count files
         try:
-            files = [f for f in os.listdir(directory) if f.endswith(('.pdf', '.docx', '.doc'))]
-            self._show_toast(f"Found {len(files)} CV files", "info")
-        except:
+            count = self._count_cv_files(directory)
+            self._show_toast(f"Found {count} CV files", "info")
+        except OSError:
             pass
     
+    def _count_cv_files(self, directory):
+        """Count CV files in a directory, reusing the last count while its mtime is unchanged"""
+        mtime = os.stat(directory).st_mtime
+        cached = self._cv_count_cache.get(directory)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        with os.scandir(directory) as entries:
+            count = sum(1 for entry in entries
+                        if entry.name.lower().endswith(CV_EXTENSIONS) and entry.is_file())
+        self._cv_count_cache[directory] = (mtime, count)
+        return count
+    
     def _on_run_analysis(self, cv_dir):
         """Handle run analysis button click"""
         job_description = self.main_panel.get_job_description()
@@ -116,19 +197,25 @@ class CVScannerModular(ctk.CTk):
         self.sidebar.show_progress(True)
         self.sidebar.set_status("🔄 Analysis in progress...", ThemeManager.COLORS["warning"])
         
-        # Clear previous results
-        self.main_panel.clear_results()
-        self.all_candidates.clear()
-        self.filtered_candidates.clear()
+        # Previous results stay on screen, and searchable, until the first newly
+        # scored candidates replace them (the lists are rebound, never cleared in
+        # place, since an open export may still be reading them)
         self.sidebar.hide_stats()
         
-        # Start analysis thread
-        thread = threading.Thread(
-            target=self._run_analysis,
-            args=(cv_dir, job_description),
-            daemon=True
-        )
-        thread.start()
+        # Show candidates as they are scored
+        self._start_live_results()
+        
+        # Hand the job to the analysis thread, starting it on first use
+        self._analysis_jobs.put((cv_dir, job_description))
+        if self._analysis_worker is None:
+            self._analysis_worker = threading.Thread(target=self._analysis_loop, daemon=True)
+            self._analysis_worker.start()
+    
+    def _analysis_loop(self):
+        """Run queued analysis jobs one after another (in background thread)"""
+        while True:
+            cv_dir, job_description = self._analysis_jobs.get()
+            self._run_analysis(cv_dir, job_description)
     
     def _run_analysis(self, cv_dir, job_description):
         """Run CV analysis (in background thread)"""
@@ -143,40 +230,98 @@ class CVScannerModular(ctk.CTk):
                 self.analyzer.parallel_workers = settings["parallel_workers"]
                 self.analyzer.enable_summaries = settings["enable_summaries"]
             
-            # Define progress callback
-            def progress_callback(current, total, elapsed):
-                self.after(0, self.sidebar.update_progress, current, total, elapsed)
-            
-            # Process CVs
+            # Process CVs (the sidebar queues progress and draws it on the Tk thread)
             all_results = self.analyzer.process_all_cvs(
                 cv_dir, 
                 job_description, 
-                progress_callback=progress_callback
+                progress_callback=self.sidebar.update_progress,
+                result_callback=self._on_result_scored
             )
             
-            # Store and categorize
-            self.all_candidates = all_results
-            
-            # Calculate stats
-            self.analysis_stats = {
-                "total": len(all_results),
-                "shortlist": sum(1 for r in all_results if "SHORTLIST" in r.get("recommendation", "").upper()),
-                "review": sum(1 for r in all_results if "REVIEW" in r.get("recommendation", "").upper()),
-                "reject": sum(1 for r in all_results if "SHORTLIST" not in r.get("recommendation", "").upper() and "REVIEW" not in r.get("recommendation", "").upper())
-            }
-            
-            top_candidates = self.analyzer.get_top_candidates(all_results, top_n=20)
+            top_candidates = self.analyzer.get_top_candidates(all_results, top_n=TOP_CANDIDATES)
             
-            # Update UI on main thread
-            self.after(0, self._on_analysis_complete, top_candidates)
+            # Store, index and update UI on main thread
+            self._worker_events.put((self._on_analysis_complete, (all_results, top_candidates)))
         except Exception as e:
-            self.after(0, self._on_analysis_error, str(e))
+            self._worker_events.put((self._on_analysis_error, (str(e),)))
     
-    def _on_analysis_complete(self, candidates):
+    def _on_result_scored(self, result):
+        """Prepare a finished result for display (in background thread) and queue it for the Tk thread"""
+        # Fill the per-candidate caches here so cards, filters and sorting only look them up
+        get_search_name(result)
+        get_score(result)
+        get_score_text(result)
+        get_category(result)
+        get_skill_partition(result)
+        get_detail_texts(result)
+        self._live_results.put(result)
+    
+    def _start_live_results(self):
+        """Start showing the best candidates scored so far while analysis runs"""
+        self._stop_live_results()
+        self._live_candidates = []
+        self._live_keys = []
+        self._live_job = self.after(LIVE_RESULTS_MS, self._poll_live_results)
+    
+    def _stop_live_results(self):
+        """Stop live updates and drop results not yet shown"""
+        if self._live_job is not None:
+            self.after_cancel(self._live_job)
+            self._live_job = None
+        while True:
+            try:
+                self._live_results.get_nowait()
+            except queue.Empty:
+                break
+    
+    def _poll_live_results(self):
+        """Merge newly scored candidates into the live top list and redisplay it if it changed"""
+        changed = False
+        while True:
+            try:
+                result = self._live_results.get_nowait()
+            except queue.Empty:
+                break
+            # Binary insert by descending score, keeping only the top candidates
+            key = -get_score(result)
+            index = bisect_right(self._live_keys, key)
+            if index < TOP_CANDIDATES:
+                self._live_keys.insert(index, key)
+                self._live_candidates.insert(index, result)
+                del self._live_keys[TOP_CANDIDATES:], self._live_candidates[TOP_CANDIDATES:]
+                changed = True
+        
+        if changed:
+            # The scored-so-far list becomes the result set that search, sort and filters apply to
+            self.all_candidates = list(self._live_candidates)
+            self._index_candidates()
+            self._apply_filters()
+        self._live_job = self.after(LIVE_RESULTS_MS, self._poll_live_results)
+    
+    def _on_analysis_complete(self, all_results, candidates):
         """Handle analysis completion"""
+        self._stop_live_results()
+        
+        # Store and categorize here, on the Tk thread that also sorts and filters them
+        self.all_candidates = all_results
+        self._index_candidates()
         self.sidebar.show_progress(False)
         self.sidebar.set_run_button_state(analyzing=False)
-        self.sidebar.set_status("✅ Analysis complete!", ThemeManager.COLORS["success"])
+        
+        # Calculate stats from the category buckets (on the Tk thread, where sorting rebuilds them)
+        by_category = self.candidates_by_category
+        self.analysis_stats = {
+            "total": len(self.all_candidates),
+            "shortlist": len(by_category["Shortlist"]),
+            "review": len(by_category["Review"]),
+            "reject": len(by_category["Other"])
+        }
+        
+        # Summarize in the status line instead of a blocking dialog
+        stats = self.analysis_stats
+        summary = f"✅ {stats['total']} analyzed • {stats['shortlist']} shortlisted"
+        self.sidebar.set_status(summary, ThemeManager.COLORS["success"])
+        self.after(COMPLETE_STATUS_MS, self._reset_status, summary)
         
         # Display results
         self.main_panel.display_results(candidates)
@@ -184,16 +329,19 @@ class CVScannerModular(ctk.CTk):
         
         # Show stats
         self.sidebar.show_stats(self.analysis_stats)
-        
-        messagebox.showinfo(
-            "Analysis Complete",
-            f"Successfully analyzed {self.analysis_stats['total']} candidates!\n\n"
-            f"Shortlisted: {self.analysis_stats['shortlist']}\n"
-            f"For Review: {self.analysis_stats['review']}"
-        )
+    
+    def _reset_status(self, message):
+        """Return the status line to ready, unless something else has replaced message"""
+        if self.sidebar.status_label.cget("text") == message:
+            self.sidebar.set_status("✓ Ready to analyze", ThemeManager.COLORS["success"])
     
     def _on_analysis_error(self, error_message):
         """Handle analysis error"""
+        self._stop_live_results()
+        self.all_candidates = []
+        self.filtered_candidates = []
+        self.candidates_by_category = {}
+        self.main_panel.clear_results()
         self.sidebar.show_progress(False)
         self.sidebar.set_run_button_state(analyzing=False)
         self.sidebar.set_status("❌ Analysis failed", ThemeManager.COLORS["danger"])
@@ -205,49 +353,47 @@ class CVScannerModular(ctk.CTk):
     
     def _on_sort(self, choice):
         """Handle sort selection"""
+        # Sort keys are cached on each candidate by _index_candidates
         if "Score" in choice:
-            self.all_candidates.sort(key=lambda x: float(x.get("fit_score", 0)), reverse=True)
+            self.all_candidates.sort(key=itemgetter("_score"), reverse=True)
         elif "Name ↑" in choice:
-            self.all_candidates.sort(key=lambda x: os.path.basename(x.get("cv_file", "")))
+            self.all_candidates.sort(key=itemgetter("_name_lc"))
         elif "Name ↓" in choice:
-            self.all_candidates.sort(key=lambda x: os.path.basename(x.get("cv_file", "")), reverse=True)
+            self.all_candidates.sort(key=itemgetter("_name_lc"), reverse=True)
         
+        # Keep the category buckets in the new order
+        self._index_candidates()
         self._apply_filters()
     
     def _on_filter(self, choice):
         """Handle filter selection"""
         self._apply_filters()
     
+    def _index_candidates(self):
+        """Cache search/sort keys and bucket candidates by category, keeping their order"""
+        by_category = {"Shortlist": [], "Review": [], "Other": []}
+        for candidate in self.all_candidates:
+            get_search_name(candidate)
+            get_score(candidate)
+            by_category[get_category(candidate)].append(candidate)
+        self.candidates_by_category = by_category
+    
     def _apply_filters(self):
         """Apply search and filter to candidates"""
         search_query = self.main_panel.get_search_query()
         filter_value = self.main_panel.filter_menu.get()
         
-        if not search_query and filter_value == "All":
-            self.main_panel.display_results(self.all_candidates[:20])
-            return
+        # Recommendation filter: a prebuilt bucket, no per-candidate checks
+        if filter_value == "All":
+            candidates = self.all_candidates
+        else:
+            candidates = self.candidates_by_category.get(filter_value, [])
         
-        filtered = []
-        for candidate in self.all_candidates:
-            name = os.path.basename(candidate.get("cv_file", "")).lower()
-            rec = candidate.get("recommendation", "").upper()
-            
-            # Apply search filter
-            if search_query and search_query not in name:
-                continue
-            
-            # Apply recommendation filter
-            if filter_value != "All":
-                if filter_value == "Shortlist" and "SHORTLIST" not in rec:
-                    continue
-                elif filter_value == "Review" and "REVIEW" not in rec:
-                    continue
-                elif filter_value == "Other" and ("SHORTLIST" in rec or "REVIEW" in rec):
-                    continue
-            
-            filtered.append(candidate)
+        # Search filter against cached lower-case names
+        if search_query:
+            candidates = [c for c in candidates if search_query in get_search_name(c)]
         
-        self.main_panel.display_results(filtered[:20])
+        self.main_panel.display_results(candidates[:TOP_CANDIDATES])
     
     def _on_export(self):
         """Handle export button click"""
@@ -258,8 +404,12 @@ class CVScannerModular(ctk.CTk):
         ExportDialog(self, self.all_candidates, self.analysis_stats)
     
     def _on_view_details(self, candidate_data):
-        """Handle view details button click"""
-        DetailsModal(self, candidate_data)
+        """Handle view details button click (one details window, reused)"""
+        modal = self._details_modal
+        if modal is not None and modal.winfo_exists():
+            modal.show_candidate(candidate_data)
+        else:
+            self._details_modal = DetailsModal(self, candidate_data)
     
     def _on_appearance_changed(self, new_mode):
         """Handle theme/appearance change"""
@@ -12,6 +12,8 @@ import os
 import sys
 import json
 import re
+import heapq
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Dict, Tuple
 import logging
@@ -80,15 +82,14 @@ class CVAnalyzer:
         if not cv_path.is_dir():
             raise ValueError(f"Path is not a directory: {cv_directory}")
         
-        # Find all PDF files using case-insensitive pattern
-        pdf_files_set = set()
+        # Find all PDF files (any extension case) in one directory pass
+        cv_path = cv_path.resolve()
+        with os.scandir(cv_path) as entries:
+            pdf_files = [cv_path / entry.name for entry in entries
+                         if entry.name.lower().endswith('.pdf') and entry.is_file()]
         
-        for pattern in ['*.pdf', '*.PDF', '*.Pdf']:
-            for file in cv_path.glob(pattern):
-                pdf_files_set.add(file.resolve())
-        
-        # Convert set back to list and sort for consistent ordering
-        pdf_files = sorted(list(pdf_files_set))
+        # Sort for consistent ordering
+        pdf_files.sort()
         
         if not pdf_files:
             raise ValueError(f"No PDF files found in directory: {cv_directory}")
@@ -481,7 +482,8 @@ Write a concise summary explaining this candidate's fit:"""
                 "cv_text_preview": cv_text[:500] if cv_text else ""
             }
     
-    def process_all_cvs(self, cv_directory: str, job_description: str, batch_size: int = 4, progress_callback=None) -> List[Dict]:
+    def process_all_cvs(self, cv_directory: str, job_description: str, batch_size: int = 4, progress_callback=None,
+                        result_callback=None) -> List[Dict]:
         """
         Process all CVs in the directory and analyze them (with parallel AI extraction)
         
@@ -490,6 +492,7 @@ Write a concise summary explaining this candidate's fit:"""
             job_description: Job description text
             batch_size: Number of CVs to process in each batch (deprecated, use config.parallel_workers)
             progress_callback: Optional callback function(current, total, elapsed_time)
+            result_callback: Optional callback function(result), called as each CV finishes
             
         Returns:
             List of analysis results for each CV
@@ -558,6 +561,14 @@ Write a concise summary explaining this candidate's fit:"""
                     completed += 1
                     if progress_callback:
                         progress_callback(completed, total_cvs, time.time() - start_time)
+                    continue
+                
+                # Outside the try above: a failing callback must not count or log the CV as failed
+                if result_callback:
+                    try:
+                        result_callback(result)
+                    except Exception as e:
+                        logger.error(f"Result callback failed for {cv_name}: {e}")
         
         logger.info(f"Successfully processed {len(results)} CVs")
         return results
@@ -573,9 +584,8 @@ Write a concise summary explaining this candidate's fit:"""
         Returns:
             Sorted list of top candidates
         """
-        # Sort by fit score (descending)
-        sorted_results = sorted(results, key=lambda x: x['fit_score'], reverse=True)
-        return sorted_results[:top_n]
+        # Partial selection by fit score (descending); same order as a full sort, ties included
+        return heapq.nlargest(top_n, results, key=itemgetter('fit_score'))
     
     def display_results(self, top_candidates: List[Dict], job_description: str):
         """